@@ -12,12 +12,19 @@ GENERAL RULES:
 """
 
 import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
 import pandas as pd
 import streamlit as st
-from pymongo.collection import Collection
-from src.database.connection import get_database
+from src.analytics.scoring import CAPITAL_CHOICES, RISK_CHOICES, adjust_scores
 from src.utils.logging import setup_logging
 
+if TYPE_CHECKING:
+    from pymongo.collection import Collection
+
 # Configure
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -29,295 +36,96 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
-# Modern Dark Blue Aesthetic Theme
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Main App Background - Beautiful Dark Blue Gradient */
-    .stApp {
-        background: linear-gradient(135deg, #0a1628 0%, #1a2332 25%, #0d1b2a 50%, #1b263b 75%, #0d1b2a 100%);
-        font-family: 'Inter', sans-serif;
-    }
-    
-    /* Main content area */
-    .main {
-        background: transparent;
-    }
-    
-    /* Beautiful gradient text for headers */
-    h1, h2, h3 {
-        background: linear-gradient(135deg, #60a5fa 0%, #3b82f6 50%, #2563eb 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        font-weight: 700;
-        letter-spacing: -0.02em;
-    }
-    
-    /* Regular text styling */
-    p, label, .stMarkdown {
-        color: #e2e8f0 !important;
-        font-weight: 400;
-    }
-    
-    /* Premium Button Styling */
-    .stButton>button {
-        background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
-        color: white;
-        border: none;
-        border-radius: 12px;
-        padding: 14px 32px;
-        font-weight: 600;
-        font-size: 16px;
-        letter-spacing: 0.5px;
-        box-shadow: 0 4px 20px rgba(59, 130, 246, 0.4);
-        transition: all 0.3s ease;
-        text-transform: uppercase;
-    }
-    
-    .stButton>button:hover {
-        background: linear-gradient(135deg, #2563eb 0%, #1d4ed8 100%);
-        box-shadow: 0 6px 30px rgba(59, 130, 246, 0.6);
-        transform: translateY(-2px);
-    }
-    
-    .stButton>button:active {
-        transform: translateY(0);
-    }
-    
-    /* Beautiful Glass-morphism Cards */
-    .result-card {
-        background: rgba(30, 41, 59, 0.7);
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(96, 165, 250, 0.2);
-        border-radius: 16px;
-        padding: 24px;
-        margin: 20px 0;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-    }
-    
-    /* Premium Score Badges */
-    .score-badge {
-        display: inline-block;
-        font-size: 52px;
-        font-weight: 700;
-        padding: 24px 48px;
-        border-radius: 16px;
-        margin: 24px 0;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-        letter-spacing: -0.02em;
-    }
-    
-    .score-high {
-        background: linear-gradient(135deg, #3b82f6 0%, #2563eb 50%, #1d4ed8 100%);
-        color: white;
-        border: 2px solid rgba(96, 165, 250, 0.3);
-    }
-    
-    .score-medium {
-        background: linear-gradient(135deg, #60a5fa 0%, #3b82f6 100%);
-        color: white;
-        border: 2px solid rgba(147, 197, 253, 0.3);
-    }
-    
-    .score-low {
-        background: linear-gradient(135deg, #475569 0%, #334155 100%);
-        color: white;
-        border: 2px solid rgba(148, 163, 184, 0.3);
-    }
-    
-    /* Modern Progress Bar */
-    .score-bar {
-        background: rgba(30, 41, 59, 0.5);
-        border-radius: 12px;
-        height: 28px;
-        margin: 12px 0;
-        overflow: hidden;
-        border: 1px solid rgba(96, 165, 250, 0.2);
-    }
-    
-    .score-fill {
-        background: linear-gradient(90deg, #3b82f6 0%, #2563eb 50%, #1d4ed8 100%);
-        height: 100%;
-        border-radius: 12px;
-        transition: width 0.5s ease;
-        display: flex;
-        align-items: center;
-        box-shadow: 0 0 20px rgba(59, 130, 246, 0.5);
-        justify-content: center;
-        color: white;
-        font-weight: 600;
-        padding-left: 12px;
-    }
-    
-    /* Premium Input Fields */
-    .stTextInput input, .stNumberInput input, .stSelectbox select {
-        background: rgba(30, 41, 59, 0.6) !important;
-        border: 1px solid rgba(96, 165, 250, 0.3) !important;
-        border-radius: 12px !important;
-        color: #e2e8f0 !important;
-        padding: 12px 16px !important;
-        font-size: 15px !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .stTextInput input:focus, .stNumberInput input:focus, .stSelectbox select:focus {
-        border-color: rgba(96, 165, 250, 0.6) !important;
-        box-shadow: 0 0 20px rgba(59, 130, 246, 0.3) !important;
-    }
-    
-    /* Section Headers with Glow */
-    .section-header {
-        font-size: 28px;
-        font-weight: 700;
-        background: linear-gradient(135deg, #60a5fa 0%, #3b82f6 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        margin-top: 32px;
-        margin-bottom: 20px;
-        border-bottom: 2px solid rgba(96, 165, 250, 0.3);
-        padding-bottom: 12px;
-    }
-    
-    /* Glass Metric Boxes */
-    .metric-box {
-        background: rgba(30, 41, 59, 0.6);
-        backdrop-filter: blur(10px);
-        padding: 20px;
-        border-radius: 12px;
-        border: 1px solid rgba(96, 165, 250, 0.2);
-        margin: 12px 0;
-        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.2);
-        transition: all 0.3s ease;
-    }
-    
-    .metric-box:hover {
-        border-color: rgba(96, 165, 250, 0.4);
-        box-shadow: 0 8px 24px rgba(59, 130, 246, 0.3);
-        transform: translateY(-2px);
-    }
-    
-    .metric-label {
-        font-size: 14px;
-        color: #94a3b8;
-        font-weight: 500;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    .metric-value {
-        font-size: 32px;
-        font-weight: 700;
-        background: linear-gradient(135deg, #60a5fa 0%, #3b82f6 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        margin-top: 8px;
-    }
-    
-    /* Metric containers */
-    [data-testid="stMetricValue"] {
-        background: linear-gradient(135deg, #60a5fa 0%, #3b82f6 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        font-weight: 700;
-    }
-    
-    /* Beautiful List Items */
-    .reason-list {
-        list-style-type: none;
-        padding-left: 0;
-    }
-    
-    .reason-item {
-        background: rgba(30, 41, 59, 0.6);
-        backdrop-filter: blur(10px);
-        padding: 16px;
-        margin: 10px 0;
-        border-radius: 12px;
-        border-left: 4px solid #3b82f6;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-        transition: all 0.3s ease;
-        color: #e2e8f0;
-    }
-    
-    .reason-item:hover {
-        border-left-color: #60a5fa;
-        box-shadow: 0 6px 20px rgba(59, 130, 246, 0.3);
-        transform: translateX(4px);
-    }
-    
-    .reason-item::before {
-        content: "✓ ";
-        color: #60a5fa;
-        font-weight: bold;
-        margin-right: 10px;
-        font-size: 18px;
-    }
-    
-    /* Data Tables */
-    .dataframe {
-        background: rgba(30, 41, 59, 0.6) !important;
-        border-radius: 12px !important;
-        overflow: hidden !important;
-    }
-    
-    .dataframe th {
-        background: rgba(59, 130, 246, 0.2) !important;
-        color: #60a5fa !important;
-        font-weight: 600 !important;
-        padding: 12px !important;
-    }
-    
-    .dataframe td {
-        color: #e2e8f0 !important;
-        padding: 10px !important;
-        border-bottom: 1px solid rgba(96, 165, 250, 0.1) !important;
-    }
-    
-    /* Sidebar styling */
-    section[data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #0a1628 0%, #1a2332 100%);
-        border-right: 1px solid rgba(96, 165, 250, 0.2);
-    }
-    
-    /* Back button */
-    .back-button {
-        background: rgba(59, 130, 246, 0.2) !important;
-        border: 1px solid rgba(96, 165, 250, 0.3) !important;
-    }
-    
-    /* Section divider */
-    hr {
-        border: none;
-        border-top: 2px solid rgba(96, 165, 250, 0.2);
-        margin: 32px 0;
-    }
-    
-    /* Charts and visualizations */
-    .js-plotly-plot {
-        border-radius: 16px;
-        overflow: hidden;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-    }
-</style>
-""", unsafe_allow_html=True)
+
+# Fields of aggregated_sectors used by the dashboard
+MARKET_COLUMNS = [
+    "sector",
+    "saturation_score",
+    "growth_rate",
+    "risk_score",
+    "active_startups",
+    "total_startups",
+    "avg_funding_per_startup",
+    "top_countries",
+]
+
+# Columns read when rendering Find results, in tuple field order
+RESULT_COLUMNS = [
+    "sector",
+    "opportunity_score",
+    "capital_label",
+    "growth_label",
+    "risk_label",
+    "size_label",
+    "saturation_label",
+    "active_label",
+    "top_countries",
+]
+
+# Numeric columns downcast at load time
+FLOAT_COLUMNS = ["saturation_score", "growth_rate", "risk_score", "avg_funding_per_startup"]
+COUNT_COLUMNS = ["active_startups", "total_startups"]
+
+# Columns kept as contiguous arrays for the Find page scoring path
+SCORE_ARRAY_COLUMNS = [
+    "sector",
+    "opportunity_score_base",
+    "saturation_score",
+    "growth_rate",
+    "risk_score",
+    "active_startups",
+    "total_startups",
+    "avg_funding_per_startup",
+]
+
+# Fraction columns and the display percentage columns derived from them
+PCT_COLUMNS = {
+    "growth_rate": "growth_pct",
+    "risk_score": "risk_pct",
+    "saturation_score": "saturation_pct",
+    "active_ratio": "active_pct",
+}
+
+# Columns read by the opportunity score
+SCORE_COLUMNS = ["saturation_score", "growth_rate", "risk_score", "active_startups", "total_startups"]
+
+
+@st.cache_data
+def load_css() -> str:
+    """Load the dashboard theme stylesheet."""
+    css = Path(__file__).with_name("theme.css").read_text(encoding="utf-8")
+    return f"<style>{css}</style>"
+
+
+@st.cache_resource
+def get_collection() -> "Collection":
+    """Long-lived aggregated_sectors handle shared across reruns and sessions."""
+    # pymongo is only needed once data is actually fetched
+    from src.database.connection import get_database
+
+    return get_database()["aggregated_sectors"]
 
 
 @st.cache_data(ttl=3600)
 def load_market_data() -> pd.DataFrame:
     """Load market intelligence data from MongoDB."""
     try:
-        db = get_database()
-        collection: Collection = db["aggregated_sectors"]
-        cursor = collection.find({})
-        df = pd.DataFrame(list(cursor))
-        if "_id" in df.columns:
-            df = df.drop(columns=["_id"])
+        collection = get_collection()
+        projection = {column: 1 for column in MARKET_COLUMNS}
+        projection["_id"] = 0
+        cursor = collection.find({}, projection=projection, batch_size=500)
+        df = pd.DataFrame.from_records(cursor, columns=MARKET_COLUMNS)
+        if not df.empty:
+            # Fractions and counts don't need 64-bit precision
+            df = df.astype({column: "float32" for column in FLOAT_COLUMNS})
+            df = df.astype({column: "int32" for column in COUNT_COLUMNS})
+            # Precompute preference-independent columns once per cache refresh
+            df["active_ratio"] = df["active_startups"] / df["total_startups"].clip(lower=1)
+            df["opportunity_score_base"] = calculate_opportunity_score_vec(df)
+            for column, pct_column in PCT_COLUMNS.items():
+                df[pct_column] = (df[column] * 100).astype("float32")
+        # Identifies this load; cached copies of the frame carry it along
+        df.attrs["load_id"] = time.time_ns()
         return df
     except Exception as e:
         logger.error(f"Error loading data: {e}")
@@ -325,8 +133,40 @@ def load_market_data() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-def calculate_opportunity_score(row: pd.Series) -> float:
-    """Calculate 0-10 opportunity score for a sector.
+def get_frame_key(df: pd.DataFrame) -> int:
+    """Cache key for data derived from the frame: the load it came from."""
+    return df.attrs["load_id"]
+
+
+@st.cache_data(ttl=3600)
+def get_country_options(df_key: int, _df: pd.DataFrame) -> tuple[str, ...]:
+    """Top country options."""
+    return tuple(_df["top_countries"].explode().dropna().unique().tolist()[:10])
+
+
+@st.cache_data(ttl=3600)
+def get_sector_options(df_key: int, _df: pd.DataFrame) -> tuple[str, ...]:
+    """Sorted sector options."""
+    return tuple(sorted(_df["sector"].unique().tolist()))
+
+
+@st.cache_data(ttl=3600)
+def get_sector_lookup(df_key: int, _df: pd.DataFrame) -> dict[str, int]:
+    """Map each sector to its row position."""
+    lookup: dict[str, int] = {}
+    for position, sector in enumerate(_df["sector"].tolist()):
+        lookup.setdefault(sector, position)
+    return lookup
+
+
+@st.cache_data(ttl=3600)
+def get_score_arrays(df_key: int, _df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Per-column arrays read by the scoring path."""
+    return {column: _df[column].to_numpy() for column in SCORE_ARRAY_COLUMNS}
+
+
+def calculate_opportunity_score_vec(df: pd.DataFrame) -> pd.Series:
+    """Calculate 0-10 opportunity scores for every sector at once.
     
     Logic:
     - Lower saturation = better (30% weight)
@@ -334,14 +174,44 @@ def calculate_opportunity_score(row: pd.Series) -> float:
     - Lower risk = better (20% weight)
     - Higher activity rate = better (20% weight)
     """
-    saturation_score = (1 - row["saturation_score"]) * 3
-    growth_score = max(0, min(3, (row["growth_rate"] + 0.1) * 15))
-    risk_score = (1 - row["risk_score"]) * 2
-    active_ratio = row["active_startups"] / max(row["total_startups"], 1)
-    activity_score = active_ratio * 2
+    saturation_score = (1 - df["saturation_score"]) * 3
+    growth_score = np.clip((df["growth_rate"] + 0.1) * 15, 0, 3)
+    risk_score = (1 - df["risk_score"]) * 2
+    activity_score = (df["active_startups"] / df["total_startups"].clip(lower=1)) * 2
     
     total = saturation_score + growth_score + risk_score + activity_score
-    return min(10, max(0, total))
+    return np.clip(total, 0, 10)
+
+
+# Server-side equivalent of calculate_opportunity_score_vec
+OPPORTUNITY_SCORE_EXPR = {
+    "$min": [10, {"$max": [0, {"$add": [
+        {"$multiply": [{"$subtract": [1, "$saturation_score"]}, 3]},
+        {"$min": [3, {"$max": [0, {"$multiply": [{"$add": ["$growth_rate", 0.1]}, 15]}]}]},
+        {"$multiply": [{"$subtract": [1, "$risk_score"]}, 2]},
+        {"$multiply": [{"$divide": ["$active_startups", {"$max": ["$total_startups", 1]}]}, 2]},
+    ]}]}],
+}
+
+
+@st.cache_data(ttl=3600)
+def fetch_top_alternatives(current_industry: str, k: int = 3) -> list[str]:
+    """Rank sectors other than the current one in MongoDB and return the top k."""
+    collection = get_collection()
+    pipeline = [
+        {"$match": {"sector": {"$ne": current_industry}}},
+        {"$addFields": {"score": OPPORTUNITY_SCORE_EXPR}},
+        {"$sort": {"score": -1, "sector": 1}},
+        {"$limit": k},
+        {"$project": {"_id": 0, "sector": 1}},
+    ]
+    return [doc["sector"] for doc in collection.aggregate(pipeline)]
+
+
+def calculate_opportunity_score(row: pd.Series) -> float:
+    """Calculate 0-10 opportunity score for a single sector row."""
+    frame = row[SCORE_COLUMNS].astype(float).to_frame().T
+    return float(calculate_opportunity_score_vec(frame).iloc[0])
 
 
 def get_score_class(score: float) -> str:
@@ -418,12 +288,14 @@ def show_find_idea_page(df: pd.DataFrame):
     # Filter Panel
     st.subheader("Your Preferences")
     
+    df_key = get_frame_key(df)
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
         location = st.selectbox(
             "Preferred Location",
-            ["Any"] + df["top_countries"].explode().dropna().unique().tolist()[:10],
+            ["Any", *get_country_options(df_key, df)],
             help="Where do you want to operate?"
         )
         
@@ -442,7 +314,7 @@ def show_find_idea_page(df: pd.DataFrame):
         
         industry = st.selectbox(
             "Preferred Industry",
-            ["Any"] + sorted(df["sector"].unique().tolist()),
+            ["Any", *get_sector_options(df_key, df)],
             help="Focus on a specific sector?"
         )
     
@@ -462,48 +334,40 @@ def show_find_idea_page(df: pd.DataFrame):
         st.subheader("Top Recommendations")
         
         # Filter data based on inputs (soft filtering - score-based)
-        filtered_df = df.copy()
+        # Scoring runs on contiguous per-column arrays; the DataFrame is only
+        # read by position for display
+        arrays = get_score_arrays(df_key, df)
         
         # Apply hard filters only for specific industry selection
-        if industry != "Any":
-            filtered_df = filtered_df[filtered_df["sector"] == industry]
-        
-        # For other filters, use scoring instead of hard filtering
-        # Calculate opportunity scores first
-        filtered_df["opportunity_score"] = filtered_df.apply(calculate_opportunity_score, axis=1)
-        
-        # Adjust scores based on preferences (soft filtering)
-        if risk_appetite == "Low Risk":
-            filtered_df["opportunity_score"] = filtered_df["opportunity_score"] + (1 - filtered_df["risk_score"]) * 2
-        elif risk_appetite == "Medium Risk":
-            # Favor medium risk
-            filtered_df["opportunity_score"] = filtered_df["opportunity_score"] + \
-                (1 - abs(filtered_df["risk_score"] - 0.45)) * 2
-        elif risk_appetite == "High Risk":
-            filtered_df["opportunity_score"] = filtered_df["opportunity_score"] + filtered_df["risk_score"] * 2
-        
-        # Adjust for capital preference
-        if capital != "Any":
-            if "< $50K" in capital:
-                # Favor lower funding requirements
-                filtered_df["opportunity_score"] = filtered_df["opportunity_score"] + \
-                    (1 - (filtered_df["avg_funding_per_startup"] / filtered_df["avg_funding_per_startup"].max())) * 1.5
-            elif "$50K - $500K" in capital:
-                # Favor mid-range funding
-                target = 275000
-                filtered_df["opportunity_score"] = filtered_df["opportunity_score"] + \
-                    (1 - abs(filtered_df["avg_funding_per_startup"] - target) / target) * 1.5
-            elif "$500K - $5M" in capital:
-                # Favor higher funding
-                filtered_df["opportunity_score"] = filtered_df["opportunity_score"] + \
-                    (filtered_df["avg_funding_per_startup"] / filtered_df["avg_funding_per_startup"].max()) * 1.5
+        if industry == "Any":
+            positions = np.arange(len(df))
+            candidates = arrays
+        else:
+            positions = np.flatnonzero(arrays["sector"] == industry)
+            candidates = {name: values[positions] for name, values in arrays.items()}
+        
+        # For other filters, use scoring instead of hard filtering:
+        # adjust the base scores precomputed at load time for each preference
+        score = adjust_scores(
+            candidates["opportunity_score_base"],
+            candidates["risk_score"],
+            candidates["avg_funding_per_startup"],
+            risk_choice=RISK_CHOICES[risk_appetite],
+            capital_choice=CAPITAL_CHOICES[capital],
+        )
         
         # Always show at least 2 best matches (or all if less than 2)
-        min_results = min(2, len(filtered_df))
-        max_results = min(5, len(filtered_df))
+        min_results = min(2, len(positions))
+        max_results = min(5, len(positions))
         
-        # Get top results
-        results = filtered_df.nlargest(max(max_results, min_results), "opportunity_score")
+        # Get top results: partition out the best k in O(n), then sort only those
+        k = max(max_results, min_results)
+        if len(positions) <= k:
+            top = np.argsort(-score, kind="stable")
+        else:
+            top = np.argpartition(score, -k)[-k:]
+            top = top[np.argsort(-score[top], kind="stable")]
+        results = df.iloc[positions[top]].assign(opportunity_score=score[top])
         
         if len(results) == 0:
             st.warning("No data available. Please check your database connection.")
@@ -512,47 +376,71 @@ def show_find_idea_page(df: pd.DataFrame):
             if len(results) >= min_results:
                 st.info(f"✨ Showing top {len(results)} opportunities ranked by best fit with your preferences")
             
-            for idx, (_, row) in enumerate(results.iterrows(), 1):
-                # Card layout
-                st.markdown(f"""
-                <div class="result-card">
-                    <h3 style="margin-top: 0;">#{idx} — {row['sector']}</h3>
-                    <div style="color: #2E5C8A; font-size: 24px; font-weight: bold; margin: 10px 0;">
-                        Score: {row['opportunity_score']:.1f}/10
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Metrics in columns
-                col1, col2, col3, col4 = st.columns(4)
-                col1.metric("Avg Capital", f"${row['avg_funding_per_startup']/1000:.0f}K")
-                col2.metric("Growth Rate", f"{row['growth_rate']*100:.1f}%")
-                col3.metric("Risk Level", f"{row['risk_score']*100:.0f}%")
-                col4.metric("Market Size", f"{row['total_startups']:,}")
+            # Format display strings for all results at once
+            results = results.assign(
+                capital_label=(results["avg_funding_per_startup"] / 1000).map("${:.0f}K".format),
+                growth_label=results["growth_pct"].map("{:.1f}%".format),
+                risk_label=results["risk_pct"].map("{:.0f}%".format),
+                saturation_label=results["saturation_pct"].map("{:.0f}%".format),
+                active_label=results["active_pct"].map("{:.0f}%".format),
+                size_label=results["total_startups"].map("{:,}".format),
+            )
+            
+            # Evaluate reason conditions for all results at once
+            low_saturation = results["saturation_score"] < 0.5
+            growing = results["growth_rate"] > 0.05
+            low_risk = results["risk_score"] < 0.4
+            high_active = results["active_ratio"] > 0.6
+            
+            # Build every result card as HTML and render them in a single call
+            chunks = []
+            rows = results[RESULT_COLUMNS].itertuples(index=False, name="Row")
+            for idx, row in enumerate(rows, 1):
+                i = idx - 1
                 
-                # Explanation bullets
-                st.markdown("**Why this is a good opportunity:**")
+                metrics = [
+                    ("Avg Capital", row.capital_label),
+                    ("Growth Rate", row.growth_label),
+                    ("Risk Level", row.risk_label),
+                    ("Market Size", row.size_label),
+                ]
+                metrics_html = "".join(
+                    f'<div class="metric-box">'
+                    f'<div class="metric-label">{label}</div>'
+                    f'<div class="metric-value">{value}</div>'
+                    f'</div>'
+                    for label, value in metrics
+                )
                 
                 reasons = []
-                if row["saturation_score"] < 0.5:
-                    reasons.append(f"Low market saturation ({row['saturation_score']*100:.0f}%) — room for new entrants")
-                if row["growth_rate"] > 0.05:
-                    reasons.append(f"Growing market with {row['growth_rate']*100:.1f}% year-over-year growth")
-                if row["risk_score"] < 0.4:
-                    reasons.append(f"Lower risk sector with {row['risk_score']*100:.0f}% failure rate")
-                if row["active_startups"] / row["total_startups"] > 0.6:
-                    reasons.append(f"High success rate — {row['active_startups']/row['total_startups']*100:.0f}% of startups remain active")
+                if low_saturation.iat[i]:
+                    reasons.append(f"Low market saturation ({row.saturation_label}) — room for new entrants")
+                if growing.iat[i]:
+                    reasons.append(f"Growing market with {row.growth_label} year-over-year growth")
+                if low_risk.iat[i]:
+                    reasons.append(f"Lower risk sector with {row.risk_label} failure rate")
+                if high_active.iat[i]:
+                    reasons.append(f"High success rate — {row.active_label} of startups remain active")
                 
                 if len(reasons) == 0:
                     reasons.append("Balanced opportunity with moderate characteristics across all metrics")
                 
-                for reason in reasons:
-                    st.markdown(f"- {reason}")
-                
-                # Additional info
-                st.markdown(f"**Top Locations:** {', '.join(row['top_countries'][:3])}")
+                reasons_html = "".join(f'<li class="reason-item">{reason}</li>' for reason in reasons)
                 
-                st.markdown("<br>", unsafe_allow_html=True)
+                chunks.append(
+                    f'<div class="result-card">'
+                    f'<h3 style="margin-top: 0;">#{idx} — {row.sector}</h3>'
+                    f'<div style="color: #2E5C8A; font-size: 24px; font-weight: bold; margin: 10px 0;">'
+                    f'Score: {row.opportunity_score:.1f}/10'
+                    f'</div>'
+                    f'<div class="metric-grid">{metrics_html}</div>'
+                    f'<p><strong>Why this is a good opportunity:</strong></p>'
+                    f'<ul class="reason-list">{reasons_html}</ul>'
+                    f'<p><strong>Top Locations:</strong> {", ".join(row.top_countries[:3])}</p>'
+                    f'</div>'
+                )
+            
+            st.markdown("".join(chunks), unsafe_allow_html=True)
 
 
 def show_evaluate_idea_page(df: pd.DataFrame):
@@ -575,18 +463,20 @@ def show_evaluate_idea_page(df: pd.DataFrame):
     # Input Panel - ALL REQUIRED
     st.subheader("Your Startup Details")
     
+    df_key = get_frame_key(df)
+    
     col1, col2 = st.columns(2)
     
     with col1:
         industry = st.selectbox(
             "Industry / Sector *",
-            sorted(df["sector"].unique().tolist()),
+            get_sector_options(df_key, df),
             help="Required: What industry are you targeting?"
         )
         
         location = st.selectbox(
             "Target Location *",
-            df["top_countries"].explode().dropna().unique().tolist()[:10],
+            get_country_options(df_key, df),
             help="Required: Where will you operate?"
         )
         
@@ -621,7 +511,7 @@ def show_evaluate_idea_page(df: pd.DataFrame):
         st.markdown("---")
         
         # Get sector data
-        sector_data = df[df["sector"] == industry].iloc[0]
+        sector_data = df.iloc[get_sector_lookup(df_key, df)[industry]]
         
         # Calculate subscores (0-10 scale)
         
@@ -687,7 +577,7 @@ def show_evaluate_idea_page(df: pd.DataFrame):
         if overall_score >= 7:
             st.success(f"""
             Your idea aligns well with market conditions in {industry}. 
-            The sector shows {sector_data['growth_rate']*100:.1f}% growth with {sector_data['saturation_score']*100:.0f}% market saturation. 
+            The sector shows {sector_data['growth_pct']:.1f}% growth with {sector_data['saturation_pct']:.0f}% market saturation. 
             Based on historical data, this represents a strong opportunity.
             """)
         elif overall_score >= 5:
@@ -706,16 +596,16 @@ def show_evaluate_idea_page(df: pd.DataFrame):
         factors = []
         
         if saturation_subscore < 5:
-            factors.append(f"**High competition:** Market is {sector_data['saturation_score']*100:.0f}% saturated with {sector_data['total_startups']:,} existing startups")
+            factors.append(f"**High competition:** Market is {sector_data['saturation_pct']:.0f}% saturated with {sector_data['total_startups']:,} existing startups")
         
         if growth_subscore < 5:
-            factors.append(f"**Limited growth:** Sector growing at {sector_data['growth_rate']*100:.1f}% annually, below average")
+            factors.append(f"**Limited growth:** Sector growing at {sector_data['growth_pct']:.1f}% annually, below average")
         
         if capital_subscore < 5:
             factors.append(f"**Capital gap:** Typical startups require ${avg_funding/1000:.0f}K, but you have ${capital/1000:.0f}K available")
         
         if risk_subscore < 5:
-            factors.append(f"**Higher risk:** {sector_data['risk_score']*100:.0f}% historical failure rate in this sector")
+            factors.append(f"**Higher risk:** {sector_data['risk_pct']:.0f}% historical failure rate in this sector")
         
         if len(factors) == 0:
             st.markdown("- All factors are within acceptable ranges")
@@ -755,22 +645,35 @@ def show_evaluate_idea_page(df: pd.DataFrame):
             st.markdown("---")
             st.subheader("Alternative Sectors to Consider")
             
-            alternatives = df[df["sector"] != industry].copy()
-            alternatives["score"] = alternatives.apply(calculate_opportunity_score, axis=1)
-            top_alternatives = alternatives.nlargest(3, "score")
+            try:
+                # Display values come from the already-loaded frame; only the
+                # ranking is delegated to the server
+                sector_lookup = get_sector_lookup(df_key, df)
+                positions = [
+                    sector_lookup[sector]
+                    for sector in fetch_top_alternatives(industry)
+                    if sector in sector_lookup
+                ]
+                top_alternatives = df.iloc[positions]
+            except Exception as e:
+                logger.warning(f"Server-side ranking failed, ranking locally: {e}")
+                alternatives = df.loc[df["sector"] != industry]
+                top_alternatives = alternatives.nlargest(3, "opportunity_score_base")
             
-            for _, alt in top_alternatives.iterrows():
-                alt_score = calculate_opportunity_score(alt)
+            for alt in top_alternatives.itertuples(index=False, name="Alternative"):
                 st.markdown(f"""
                 <div class="result-card">
-                    <strong>{alt['sector']}</strong> (Score: {alt_score:.1f}/10)<br>
-                    Growth: {alt['growth_rate']*100:.1f}% | Risk: {alt['risk_score']*100:.0f}% | Saturation: {alt['saturation_score']*100:.0f}%
+                    <strong>{alt.sector}</strong> (Score: {alt.opportunity_score_base:.1f}/10)<br>
+                    Growth: {alt.growth_pct:.1f}% | Risk: {alt.risk_pct:.0f}% | Saturation: {alt.saturation_pct:.0f}%
                 </div>
                 """, unsafe_allow_html=True)
 
 
 def main():
     """Main app entry point."""
+    # Modern Dark Blue Aesthetic Theme
+    st.markdown(load_css(), unsafe_allow_html=True)
+    
     # Initialize session state
     if "page" not in st.session_state:
         st.session_state.page = "home"
@@ -22,6 +22,11 @@ echo "Step 3: Data Aggregation (Aggregated Layer)"
 echo "--------------------------------------------"
 uv run python -m src.pipeline.aggregate
 
+echo ""
+echo "Step 4: Materialized Views"
+echo "--------------------------"
+uv run python -m src.pipeline.materialize
+
 echo ""
 echo "=========================================="
 echo "Pipeline completed successfully!"
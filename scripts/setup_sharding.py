@@ -7,9 +7,11 @@ This script:
 """
 
 import logging
-from pymongo import MongoClient
+from pymongo import IndexModel, MongoClient
 from pymongo.errors import OperationFailure
 
+from src.models.startup import CapitalDistribution
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -52,18 +54,20 @@ def setup_sharding() -> None:
             else:
                 logger.warning(f"Could not shard raw_startups: {e}")
         
-        # Shard the clean_startups collection with compound key
-        # This co-locates documents by sector for efficient aggregation
+        # Shard the clean_startups collection with a hashed compound key
+        # The sector prefix keeps sector queries targeted, while hashing _id
+        # spreads a popular sector's documents over many chunks instead of
+        # one ever-growing hot chunk (ObjectIds are monotonic)
         try:
             # First ensure the shard key fields exist as an index
             db = client["startup_analytics"]
-            db.clean_startups.create_index([("sector", 1), ("_id", 1)])
+            db.clean_startups.create_index([("sector", 1), ("_id", "hashed")])
             
             client.admin.command({
                 "shardCollection": "startup_analytics.clean_startups",
-                "key": {"sector": 1, "_id": 1}
+                "key": {"sector": 1, "_id": "hashed"}
             })
-            logger.info("✓ Sharded clean_startups with compound key {sector: 1, _id: 1}")
+            logger.info('✓ Sharded clean_startups with compound key {sector: 1, _id: "hashed"}')
         except OperationFailure as e:
             if "already sharded" in str(e):
                 logger.info("✓ clean_startups already sharded")
@@ -73,22 +77,79 @@ def setup_sharding() -> None:
         # Create indexes for query performance
         db = client["startup_analytics"]
         
-        # Indexes on clean_startups
+        # Indexes on clean_startups (one createIndexes command per collection)
         logger.info("Creating indexes on clean_startups...")
-        db.clean_startups.create_index([("sector", 1)])
-        db.clean_startups.create_index([("founded_year", 1)])
-        db.clean_startups.create_index([("status", 1)])
+        db.clean_startups.create_indexes([
+            IndexModel([("sector", 1)]),
+            IndexModel([("founded_year", 1)]),
+            IndexModel([("status", 1)]),
+            # Equality on sector, range on funding: lets sector/funding counts use COUNT_SCAN
+            IndexModel([("sector", 1), ("total_funding", 1)]),
+        ])
         logger.info("✓ Created indexes on clean_startups")
         
         # Indexes on aggregated_sectors
         # Note: aggregated_sectors is NOT sharded (small collection)
         logger.info("Creating indexes on aggregated_sectors...")
-        db.aggregated_sectors.create_index([("sector", 1)], unique=True)
-        db.aggregated_sectors.create_index([("total_startups", 1)])
-        db.aggregated_sectors.create_index([("growth_rate", 1)])
-        db.aggregated_sectors.create_index([("risk_score", 1)])
+        db.aggregated_sectors.create_indexes([
+            IndexModel([("sector", 1)], unique=True),
+            IndexModel([("total_startups", 1)]),
+            IndexModel([("growth_rate", 1)]),
+            IndexModel([("risk_score", 1)]),
+            # Covering indexes (equality -> sort -> range) for the example queries
+            IndexModel([
+                ("growth_rate", -1), ("risk_score", 1), ("sector", 1), ("total_startups", 1)
+            ]),
+            IndexModel([
+                ("total_funding", -1), ("sector", 1), ("total_startups", 1), ("avg_funding_per_startup", 1)
+            ]),
+            IndexModel([
+                ("avg_funding_per_startup", -1), ("sector", 1), ("total_startups", 1)
+            ]),
+            IndexModel([("year_span", -1)]),
+        ])
         logger.info("✓ Created indexes on aggregated_sectors")
         
+        # Enforce the fixed capital_distribution shape on aggregated_sectors
+        capital_fields = list(CapitalDistribution.model_fields)
+        validator = {
+            "$jsonSchema": {
+                "bsonType": "object",
+                "properties": {
+                    "capital_distribution": {
+                        "bsonType": "object",
+                        "required": capital_fields,
+                        "additionalProperties": False,
+                        "properties": {
+                            field: {"bsonType": ["int", "long"], "minimum": 0}
+                            for field in capital_fields
+                        },
+                    }
+                },
+            }
+        }
+        if "aggregated_sectors" in db.list_collection_names():
+            # Rewrite documents stored with range labels as keys into the fixed
+            # fields first; the validator would reject later updates to them
+            migrated = db.aggregated_sectors.update_many(
+                {"capital_distribution.cap_0": {"$exists": False}},
+                [{"$set": {"capital_distribution": {
+                    field: {"$ifNull": [
+                        {"$getField": {"field": info.alias, "input": "$capital_distribution"}},
+                        0,
+                    ]}
+                    for field, info in CapitalDistribution.model_fields.items()
+                }}}],
+            )
+            logger.info(
+                f"✓ Migrated {migrated.modified_count} aggregated_sectors documents "
+                "to fixed capital_distribution fields"
+            )
+            db.command("collMod", "aggregated_sectors", validator=validator)
+        else:
+            db.create_collection("aggregated_sectors", validator=validator)
+        logger.info("✓ Added capital_distribution schema validator to aggregated_sectors")
+        
         # Show sharding status
         logger.info("\n" + "="*60)
         logger.info("SHARDING STATUS")
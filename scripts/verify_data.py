@@ -1,34 +1,32 @@
 """Verify data in MongoDB collections - shows row/column counts for presentation."""
 
 import logging
-from pymongo.collection import Collection
+from collections.abc import Mapping
+from typing import Any
 
-from src.database.connection import get_database
-from src.database.operations import count_documents, get_schema_sample
+from src.database.operations import estimated_count, get_schema_sample
 from src.utils.logging import setup_logging
 
 logger = logging.getLogger(__name__)
 
 
-def get_column_count(collection_name: str) -> int:
-    """Get number of unique columns in a collection."""
-    samples = get_schema_sample(collection_name, 10)
-    if not samples:
-        return 0
-
+def get_column_count(samples: list[dict[str, Any]]) -> int:
+    """Get number of unique columns across sample documents."""
     all_keys = set()
     for sample in samples:
         all_keys.update(sample.keys())
 
-    # Remove MongoDB _id
-    all_keys.discard("_id")
     return len(all_keys)
 
 
 def show_collection_stats(collection_name: str) -> None:
     """Show detailed collection statistics."""
-    row_count = count_documents(collection_name)
-    col_count = get_column_count(collection_name)
+    row_count = estimated_count(collection_name)
+    # One round trip serves both the column count and the schema preview.
+    # Counting only needs keys, so leave _id on the server and keep nested
+    # documents as raw BSON
+    samples = get_schema_sample(collection_name, 10, projection={"_id": 0}, raw=True)
+    col_count = get_column_count(samples)
 
     print(f"\n{'='*70}")
     print(f"Collection: {collection_name}")
@@ -37,11 +35,12 @@ def show_collection_stats(collection_name: str) -> None:
     print(f"Column Count: {col_count}")
 
     # Show sample schema
-    samples = get_schema_sample(collection_name, 1)
     if samples:
         sample = samples[0]
         print(f"\nSample Schema (first document):")
         for key, value in list(sample.items())[:15]:
+            if isinstance(value, Mapping):
+                value = dict(value)
             value_type = type(value).__name__
             value_preview = str(value)[:50] if value else "None"
             print(f"  - {key}: {value_type} = {value_preview}")
@@ -0,0 +1,9 @@
+"""Market analytics."""
+
+from src.analytics.scoring import (
+    CAPITAL_CHOICES,
+    RISK_CHOICES,
+    adjust_scores,
+)
+
+__all__ = ["CAPITAL_CHOICES", "RISK_CHOICES", "adjust_scores"]
@@ -0,0 +1,118 @@
+"""Opportunity score adjustments.
+
+The dashboard ranks sectors by a base opportunity score plus soft
+adjustments for the user's risk appetite and available capital. The
+adjustments run as in-place NumPy expressions over the per-sector arrays.
+"""
+
+import numpy as np
+
+# Risk appetite codes
+RISK_ANY = 0
+RISK_LOW = 1
+RISK_MEDIUM = 2
+RISK_HIGH = 3
+
+# Capital preference codes
+CAPITAL_ANY = 0
+CAPITAL_UNDER_50K = 1
+CAPITAL_50K_500K = 2
+CAPITAL_500K_5M = 3
+
+RISK_CHOICES = {
+    "Any": RISK_ANY,
+    "Low Risk": RISK_LOW,
+    "Medium Risk": RISK_MEDIUM,
+    "High Risk": RISK_HIGH,
+}
+
+# "$5M+" has no adjustment, same as "Any"
+CAPITAL_CHOICES = {
+    "Any": CAPITAL_ANY,
+    "< $50K": CAPITAL_UNDER_50K,
+    "$50K - $500K": CAPITAL_50K_500K,
+    "$500K - $5M": CAPITAL_500K_5M,
+    "$5M+": CAPITAL_ANY,
+}
+
+MEDIUM_RISK_TARGET = 0.45
+MID_CAPITAL_TARGET = 275000.0
+
+
+def _adjust_scores_numpy(
+    score: np.ndarray,
+    risk: np.ndarray,
+    funding: np.ndarray,
+    risk_choice: int,
+    capital_choice: int,
+    funding_max: float,
+) -> None:
+    """Apply preference adjustments to score in place.
+
+    Each expression is evaluated into one reusable buffer with ufunc ``out=``
+    arguments, so no intermediate arrays are allocated.
+    """
+    if risk_choice == RISK_ANY and capital_choice == CAPITAL_ANY:
+        return
+    buffer = np.empty_like(score)
+
+    # Risk appetite
+    if risk_choice == RISK_LOW:
+        # (1 - risk) * 2
+        np.subtract(1, risk, out=buffer)
+        buffer *= 2
+        score += buffer
+    elif risk_choice == RISK_MEDIUM:
+        # (1 - |risk - target|) * 2
+        np.subtract(risk, MEDIUM_RISK_TARGET, out=buffer)
+        np.abs(buffer, out=buffer)
+        np.subtract(1, buffer, out=buffer)
+        buffer *= 2
+        score += buffer
+    elif risk_choice == RISK_HIGH:
+        # risk * 2
+        np.multiply(risk, 2, out=buffer)
+        score += buffer
+
+    # Capital preference
+    if capital_choice == CAPITAL_UNDER_50K:
+        # (1 - funding / max) * 1.5
+        np.divide(funding, funding_max, out=buffer)
+        np.subtract(1, buffer, out=buffer)
+        buffer *= 1.5
+        score += buffer
+    elif capital_choice == CAPITAL_50K_500K:
+        # (1 - |funding - target| / target) * 1.5
+        np.subtract(funding, MID_CAPITAL_TARGET, out=buffer)
+        np.abs(buffer, out=buffer)
+        buffer /= MID_CAPITAL_TARGET
+        np.subtract(1, buffer, out=buffer)
+        buffer *= 1.5
+        score += buffer
+    elif capital_choice == CAPITAL_500K_5M:
+        # funding / max * 1.5
+        np.divide(funding, funding_max, out=buffer)
+        buffer *= 1.5
+        score += buffer
+
+
+def adjust_scores(
+    base: np.ndarray,
+    risk: np.ndarray,
+    funding: np.ndarray,
+    risk_choice: int = RISK_ANY,
+    capital_choice: int = CAPITAL_ANY,
+) -> np.ndarray:
+    """Return base opportunity scores adjusted for risk and capital preferences.
+
+    base, risk and funding are aligned per-sector arrays; the inputs are not
+    modified.
+    """
+    score = np.array(base, dtype=np.float64)
+    risk = np.ascontiguousarray(risk, dtype=np.float64)
+    funding = np.ascontiguousarray(funding, dtype=np.float64)
+    funding_max = funding.max(initial=0.0)
+
+    _adjust_scores_numpy(score, risk, funding, risk_choice, capital_choice, funding_max)
+
+    return score
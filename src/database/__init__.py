@@ -1,20 +1,29 @@
 """MongoDB operations."""
 
-from src.database.connection import get_mongo_client, get_database
+from src.database.connection import get_mongo_client, get_database, get_collection
 from src.database.operations import (
     insert_documents,
+    insert_dataframe,
+    iter_documents,
     count_documents,
+    estimated_count,
     get_schema_sample,
     get_collection_stats,
+    load_dataframe,
 )
 
 __all__ = [
     "get_mongo_client",
     "get_database",
+    "get_collection",
     "insert_documents",
+    "insert_dataframe",
+    "iter_documents",
     "count_documents",
+    "estimated_count",
     "get_schema_sample",
     "get_collection_stats",
+    "load_dataframe",
 ]
 
 
@@ -1,8 +1,14 @@
 """MongoDB connection."""
 
+import atexit
 import logging
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Optional
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
 from pymongo import MongoClient
+from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 
@@ -12,6 +18,21 @@ logger = logging.getLogger(__name__)
 
 _client: Optional[MongoClient] = None
 
+# Documents stay as raw BSON bytes and are only decoded when a field is read
+RAW_CODEC_OPTIONS = CodecOptions(document_class=RawBSONDocument)
+
+# Python modules backing the optional wire compressors (zlib is built in)
+_COMPRESSOR_MODULES = {"snappy": "snappy", "zstd": "zstandard"}
+
+
+def available_compressors(compressors: str) -> list[str]:
+    """Drop compressors whose module isn't installed (pymongo warns about each)."""
+    names = [name.strip() for name in compressors.split(",") if name.strip()]
+    return [
+        name for name in names
+        if name not in _COMPRESSOR_MODULES or find_spec(_COMPRESSOR_MODULES[name]) is not None
+    ]
+
 
 def get_mongo_client() -> MongoClient:
     """Get MongoDB client (connects to mongos router for sharded cluster).
@@ -47,7 +68,16 @@ def get_mongo_client() -> MongoClient:
                 serverSelectionTimeoutMS=10000,
                 connectTimeoutMS=10000,
                 directConnection=use_direct,
+                compressors=available_compressors(config.mongodb_compressors),
+                zlibCompressionLevel=config.mongodb_zlib_level,
+                maxPoolSize=config.mongodb_max_pool_size,
+                minPoolSize=config.mongodb_min_pool_size,
+                maxIdleTimeMS=config.mongodb_max_idle_time_ms,
+                retryReads=True,
+                retryWrites=True,
+                readPreference=config.mongodb_read_preference,
             )
+            atexit.register(close_mongo_client)
             _client.admin.command("ping")
             
             # Check connection type
@@ -61,10 +91,26 @@ def get_mongo_client() -> MongoClient:
     return _client
 
 
+def close_mongo_client() -> None:
+    """Close the shared client (registered to run at interpreter exit)."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+    get_database.cache_clear()
+
+
+@lru_cache(maxsize=1)
 def get_database() -> Database:
-    """Get database."""
+    """Get database (cached handle on the shared client)."""
     config = get_config()
     client = get_mongo_client()
     return client[config.mongodb_database]
 
 
+def get_collection(name: str, raw: bool = False) -> Collection:
+    """Get collection, optionally returning RawBSONDocument results."""
+    db = get_database()
+    if raw:
+        return db.get_collection(name, codec_options=RAW_CODEC_OPTIONS)
+    return db[name]
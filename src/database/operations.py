@@ -1,49 +1,148 @@
 """MongoDB operations."""
 
 import logging
-from typing import Any, Optional
-from pymongo.collection import Collection
-from pymongo.database import Database
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, Optional
+
+import bson
+import pandas as pd
+import pyarrow as pa
 from pymongo.errors import BulkWriteError
 
-from src.database.connection import get_database
+from src.database.connection import get_collection, get_database
+
+try:
+    from pymongoarrow.api import Schema, find_arrow_all
+    from pymongoarrow.api import write as write_arrow
+except ImportError:  # pymongoarrow is optional
+    find_arrow_all = write_arrow = None
 
 logger = logging.getLogger(__name__)
 
+# Keep each insert_many batch under the 16MB BSON document limit, with headroom
+MAX_BATCH_BYTES = 14 * 1024 * 1024
+
+# Rows per insert batch; DataFrame chunks are built at the same size so each
+# chunk's dicts can be freed once its batch is sent
+BATCH_SIZE = 5000
+
+
+def fit_batch_size(sample: list[dict[str, Any]], batch_size: int) -> int:
+    """Cap batch_size so a batch of documents like sample stays under MAX_BATCH_BYTES."""
+    if not sample:
+        return batch_size
+    avg_bytes = sum(len(bson.encode(doc)) for doc in sample) / len(sample)
+    return max(1, min(batch_size, int(MAX_BATCH_BYTES // avg_bytes)))
+
+
+def iter_documents(df: pd.DataFrame, chunk_size: int = BATCH_SIZE) -> Iterator[dict[str, Any]]:
+    """Yield DataFrame rows as documents (missing values as None), one chunk at a time."""
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        # Only columns that actually have NaN/NaT in this chunk are boxed and scrubbed
+        missing = chunk.isna()
+        scrubbed = {
+            column: chunk[column].astype(object).where(~missing[column], None)
+            for column in chunk.columns[missing.any().to_numpy()]
+        }
+        if scrubbed:
+            chunk = chunk.assign(**scrubbed)
+        yield from chunk.to_dict("records")
+
 
 def insert_documents(
     collection_name: str,
-    documents: list[dict[str, Any]],
-    batch_size: int = 1000,
+    documents: Iterable[dict[str, Any]],
+    batch_size: int = BATCH_SIZE,
+    bypass_validation: bool = False,
 ) -> int:
-    """Insert documents in batches."""
+    """Insert documents in batches, consuming any iterable without copying it.
+
+    bypass_validation skips server-side schema validation; only use it for
+    bulk loads whose documents the pipeline models have already validated.
+    """
     db = get_database()
     collection = db[collection_name]
 
+    # Size batches from a peek at the first documents
+    iterator = iter(documents)
+    sample = list(islice(iterator, 100))
+    batch_size = fit_batch_size(sample, batch_size)
+    iterator = chain(sample, iterator)
+
     inserted_count = 0
-    total_docs = len(documents)
+    batch_number = 0
 
-    for i in range(0, total_docs, batch_size):
-        batch = documents[i : i + batch_size]
+    while batch := list(islice(iterator, batch_size)):
+        batch_number += 1
         try:
-            result = collection.insert_many(batch, ordered=False)
+            result = collection.insert_many(
+                batch, ordered=False, bypass_document_validation=bypass_validation
+            )
             inserted_count += len(result.inserted_ids)
             logger.info(
-                f"Inserted batch {i // batch_size + 1}: "
-                f"{len(result.inserted_ids)} documents "
-                f"({inserted_count}/{total_docs} total)"
+                "Inserted batch %d: %d documents (%d total)",
+                batch_number, len(result.inserted_ids), inserted_count,
             )
         except BulkWriteError as e:
             inserted_count += e.details.get("nInserted", 0)
             logger.warning(
-                f"Batch insert had some failures: {e.details.get('nInserted', 0)} "
-                f"inserted, {len(e.details.get('writeErrors', []))} errors"
+                "Batch insert had some failures: %d inserted, %d errors",
+                e.details.get("nInserted", 0), len(e.details.get("writeErrors", [])),
             )
 
     logger.info(f"Total documents inserted into {collection_name}: {inserted_count}")
     return inserted_count
 
 
+def load_dataframe(
+    collection_name: str,
+    schema: Optional[pa.Schema] = None,
+    batch_size: int = 10000,
+) -> pd.DataFrame:
+    """Load a collection (without _id) into a DataFrame, batch by batch."""
+    db = get_database()
+    collection = db[collection_name]
+
+    # With pymongoarrow and a known schema, decode BSON straight into Arrow
+    if schema is not None and find_arrow_all is not None:
+        arrow_schema = Schema({field.name: field.type for field in schema})
+        return find_arrow_all(collection, {}, schema=arrow_schema).to_pandas()
+
+    # Otherwise build one small frame per cursor batch, so only batch_size
+    # documents are held as dicts at a time
+    cursor = collection.find({}, {"_id": 0}, batch_size=batch_size)
+    frames = []
+    while batch := list(islice(cursor, batch_size)):
+        frames.append(pd.DataFrame.from_records(batch))
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def insert_dataframe(collection_name: str, df: pd.DataFrame) -> int:
+    """Insert DataFrame rows, encoding Arrow batches to BSON directly when possible."""
+    if write_arrow is None:
+        # Raw and clean bulk loads are checked column-at-a-time before insert
+        return insert_documents(collection_name, iter_documents(df), bypass_validation=True)
+
+    db = get_database()
+    collection = db[collection_name]
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Categoricals arrive dictionary-encoded; store their plain values
+    columns = [
+        column.cast(column.type.value_type) if pa.types.is_dictionary(column.type) else column
+        for column in table.columns
+    ]
+    table = pa.Table.from_arrays(columns, names=table.column_names)
+
+    result = write_arrow(collection, table)
+    inserted_count = result.raw_result.get("insertedCount", 0)
+    logger.info(f"Total documents inserted into {collection_name}: {inserted_count}")
+    return inserted_count
+
+
 def count_documents(collection_name: str, filter_dict: Optional[dict[str, Any]] = None) -> int:
     """Count documents."""
     db = get_database()
@@ -52,11 +151,25 @@ def count_documents(collection_name: str, filter_dict: Optional[dict[str, Any]]
     return count
 
 
-def get_schema_sample(collection_name: str, sample_size: int = 5) -> list[dict[str, Any]]:
-    """Get sample documents."""
+def estimated_count(collection_name: str) -> int:
+    """Approximate document count from collection metadata."""
     db = get_database()
     collection = db[collection_name]
-    samples = list(collection.find().limit(sample_size))
+    return collection.estimated_document_count()
+
+
+def get_schema_sample(
+    collection_name: str,
+    sample_size: int = 5,
+    projection: Optional[dict[str, Any]] = None,
+    raw: bool = False,
+) -> list[dict[str, Any]]:
+    """Get a random sample of documents (drawn across shards), optionally projected."""
+    collection = get_collection(collection_name, raw=raw)
+    pipeline: list[dict[str, Any]] = [{"$sample": {"size": sample_size}}]
+    if projection:
+        pipeline.append({"$project": projection})
+    samples = list(collection.aggregate(pipeline, allowDiskUse=False))
     return samples
 
 
@@ -66,9 +179,9 @@ def get_collection_stats(collection_name: str) -> dict[str, Any]:
     collection = db[collection_name]
 
     stats = {
-        "count": collection.count_documents({}),
+        "count": collection.estimated_document_count(),
         "indexes": list(collection.list_indexes()),
-        "sample": get_schema_sample(collection_name, 1),
+        "sample": get_schema_sample(collection_name, 1, projection={"_id": 0}),
     }
 
     return stats
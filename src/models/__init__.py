@@ -1,5 +1,6 @@
-from src.models.startup import StartupRaw, StartupClean, SectorAggregate
+from src.models.schema import STARTUP_SCHEMA, validate_batch, validate_df
+from src.models.startup import StartupRaw, StartupClean, SectorAggregate, CapitalDistribution
 
-__all__ = ["StartupRaw", "StartupClean", "SectorAggregate"]
+__all__ = ["StartupRaw", "StartupClean", "SectorAggregate", "CapitalDistribution", "STARTUP_SCHEMA", "validate_batch", "validate_df"]
 
 
@@ -0,0 +1,130 @@
+"""Columnar (Arrow) schema and vectorized validation for bulk startup data."""
+
+from typing import Any, Final, Iterable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Arrow mirror of StartupRaw
+STARTUP_SCHEMA = pa.schema([
+    pa.field("name", pa.string(), nullable=False),
+    pa.field("sector", pa.string(), nullable=False),
+    pa.field("founded_year", pa.int64()),
+    pa.field("funding_rounds", pa.int64()),
+    pa.field("total_funding", pa.float64()),
+    pa.field("last_funding_date", pa.string()),
+    pa.field("status", pa.string()),
+    pa.field("country", pa.string()),
+    pa.field("city", pa.string()),
+    pa.field("employee_count", pa.int64()),
+    pa.field("first_funding_year", pa.int64()),
+    pa.field("last_funding_year", pa.int64()),
+    pa.field("time_to_first_funding_days", pa.int64()),
+    pa.field("time_to_last_funding_days", pa.int64()),
+])
+
+# Fields checked the same way as StartupRaw's year bounds and ge=0 constraints
+YEAR_FIELDS = ("founded_year", "first_funding_year", "last_funding_year")
+NON_NEGATIVE_FIELDS = (
+    "funding_rounds",
+    "total_funding",
+    "employee_count",
+    "time_to_first_funding_days",
+    "time_to_last_funding_days",
+)
+# Low-cardinality text fields, held as pandas categoricals between stages
+CATEGORICAL_FIELDS = ("sector", "status", "country", "capital_range", "funding_stage")
+
+# Capital ranges in ascending order, bucketed over half-open [low, high) bins;
+# the first bin holds exactly zero
+CAPITAL_RANGES: Final[tuple[str, ...]] = ("0-0", "0-1M", "1M-10M", "10M-50M", "50M+")
+CAPITAL_RANGE_BINS: Final[tuple[float, ...]] = (
+    0.0, float(np.nextafter(0.0, 1.0)), 1e6, 1e7, 5e7, np.inf,
+)
+CAPITAL_RANGE_DTYPE: Final = pd.CategoricalDtype(CAPITAL_RANGES, ordered=True)
+
+MIN_YEAR = 1900
+MAX_YEAR = 2030
+
+# Known sector and status vocabularies
+SECTORS: Final[tuple[str, ...]] = (
+    "Technology",
+    "Healthcare",
+    "Finance",
+    "E-commerce",
+    "Education",
+    "Real Estate",
+    "Transportation",
+    "Energy",
+    "Food & Beverage",
+    "Entertainment",
+    "Manufacturing",
+    "Agriculture",
+    "Retail",
+    "Telecommunications",
+    "Media",
+    "Consulting",
+    "Travel",
+    "Fitness",
+    "Legal",
+    "Construction",
+)
+
+SECTORS_SET: Final[frozenset[str]] = frozenset(SECTORS)
+
+STATUSES: Final[tuple[str, ...]] = ("active", "closed", "acquired", "ipo", "unknown")
+
+
+def categorical_dtypes(columns: Iterable[str]) -> dict[str, Any]:
+    """astype mapping for the categorical fields among columns."""
+    return {
+        col: CAPITAL_RANGE_DTYPE if col == "capital_range" else "category"
+        for col in CATEGORICAL_FIELDS
+        if col in columns
+    }
+
+
+def valid_mask(batch: pa.RecordBatch) -> pa.BooleanArray:
+    """Rows that pass StartupRaw's field checks; missing values are valid."""
+    checks = []
+    for field in YEAR_FIELDS:
+        if field in batch.schema.names:
+            column = batch.column(field)
+            in_range = pc.and_(
+                pc.greater_equal(column, MIN_YEAR),
+                pc.less_equal(column, MAX_YEAR),
+            )
+            checks.append(pc.fill_null(in_range, True))
+    for field in NON_NEGATIVE_FIELDS:
+        if field in batch.schema.names:
+            non_negative = pc.greater_equal(batch.column(field), 0)
+            checks.append(pc.fill_null(non_negative, True))
+
+    mask = pa.nulls(batch.num_rows, pa.bool_()).fill_null(True)
+    for check in checks:
+        mask = pc.and_(mask, check)
+    return mask
+
+
+def validate_df(df: pd.DataFrame) -> np.ndarray:
+    """Boolean mask of DataFrame rows that pass StartupRaw's field checks."""
+    checked = [col for col in (*YEAR_FIELDS, *NON_NEGATIVE_FIELDS) if col in df.columns]
+    if not checked:
+        return np.ones(len(df), dtype=bool)
+    batch = pa.RecordBatch.from_pandas(
+        df[checked].apply(pd.to_numeric, errors="coerce"), preserve_index=False
+    )
+    return valid_mask(batch).to_numpy(zero_copy_only=False)
+
+
+def validate_batch(batch: pa.RecordBatch) -> pa.RecordBatch:
+    """Drop invalid rows and normalize sector names, column-at-a-time."""
+    batch = batch.filter(valid_mask(batch))
+    if "sector" in batch.schema.names:
+        index = batch.schema.get_field_index("sector")
+        columns = batch.columns
+        columns[index] = pc.utf8_title(pc.utf8_trim_whitespace(columns[index]))
+        batch = pa.RecordBatch.from_arrays(columns, schema=batch.schema)
+    return batch
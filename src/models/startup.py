@@ -1,16 +1,30 @@
 """Startup data models."""
 
+import sys
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from src.models.schema import MAX_YEAR, MIN_YEAR, SECTORS, STATUSES
+
+# Normalized spellings of known values, keyed by lower-case form and interned
+# so every model instance shares one string per value
+_SECTOR_NORM = {sector.lower(): sys.intern(sector.title()) for sector in SECTORS}
+_STATUS_NORM = {status: sys.intern(status) for status in STATUSES}
+
+# Immutable records with a fixed field set; strings arrive pre-stripped
+RECORD_CONFIG = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
 
 
 class StartupRaw(BaseModel):
     """Raw startup data."""
 
+    model_config = RECORD_CONFIG
+
     name: str
     sector: str
-    founded_year: Optional[int] = None
+    # Year bounds are declarative so pydantic-core checks them natively
+    founded_year: Optional[int] = Field(None, ge=MIN_YEAR, le=MAX_YEAR)
     funding_rounds: Optional[int] = Field(None, ge=0)
     total_funding: Optional[float] = Field(None, ge=0)
     last_funding_date: Optional[str] = None
@@ -18,22 +32,17 @@ class StartupRaw(BaseModel):
     country: Optional[str] = None
     city: Optional[str] = None
     employee_count: Optional[int] = Field(None, ge=0)
-    first_funding_year: Optional[int] = None
-    last_funding_year: Optional[int] = None
+    first_funding_year: Optional[int] = Field(None, ge=MIN_YEAR, le=MAX_YEAR)
+    last_funding_year: Optional[int] = Field(None, ge=MIN_YEAR, le=MAX_YEAR)
     time_to_first_funding_days: Optional[int] = Field(None, ge=0)
     time_to_last_funding_days: Optional[int] = Field(None, ge=0)
 
-    @field_validator("founded_year", "first_funding_year", "last_funding_year")
-    @classmethod
-    def validate_year(cls, v: Optional[int]) -> Optional[int]:
-        if v is not None and (v < 1900 or v > 2030):
-            raise ValueError(f"Invalid year: {v}")
-        return v
-
 
 class StartupClean(BaseModel):
     """Cleaned startup data."""
 
+    model_config = RECORD_CONFIG
+
     name: str
     sector: str
     founded_year: Optional[int] = None
@@ -54,19 +63,36 @@ class StartupClean(BaseModel):
     @field_validator("sector")
     @classmethod
     def normalize_sector(cls, v: str) -> str:
-        return v.strip().title()
+        key = v.lower()
+        return _SECTOR_NORM.get(key) or key.title()
 
     @field_validator("status")
     @classmethod
     def normalize_status(cls, v: str) -> str:
         if not v:
             return "unknown"
-        return v.strip().lower()
+        status = v.lower()
+        return _STATUS_NORM.get(status, status)
+
+
+class CapitalDistribution(BaseModel):
+    """Startup counts per capital range, stored with fixed field names."""
+
+    # Unknown range labels raise rather than silently dropping their counts
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    cap_0: int = Field(0, ge=0, alias="0-0")
+    cap_0_1m: int = Field(0, ge=0, alias="0-1M")
+    cap_1m_10m: int = Field(0, ge=0, alias="1M-10M")
+    cap_10m_50m: int = Field(0, ge=0, alias="10M-50M")
+    cap_50m_plus: int = Field(0, ge=0, alias="50M+")
 
 
 class SectorAggregate(BaseModel):
     """Sector aggregation data."""
 
+    model_config = RECORD_CONFIG
+
     sector: str
     total_startups: int = Field(ge=0)
     active_startups: int = Field(ge=0)
@@ -79,11 +105,9 @@ class SectorAggregate(BaseModel):
     avg_employee_count: Optional[float] = None
     founded_year_min: Optional[int] = None
     founded_year_max: Optional[int] = None
+    year_span: Optional[int] = None
     growth_rate: float
     saturation_score: float = Field(ge=0, le=1)
     risk_score: float = Field(ge=0, le=1)
     top_countries: list[str] = Field(default_factory=list)
-    capital_distribution: dict[str, int] = Field(default_factory=dict)
-
-
-
+    capital_distribution: CapitalDistribution = Field(default_factory=CapitalDistribution)
@@ -3,12 +3,22 @@
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
-from pymongo.collection import Collection
+from pydantic import ValidationError
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from src.database.connection import get_database
-from src.database.operations import insert_documents, count_documents, get_schema_sample
+from src.database.operations import (
+    count_documents,
+    get_schema_sample,
+    insert_documents,
+    iter_documents,
+    load_dataframe,
+)
+from src.models.schema import categorical_dtypes
 from src.models.startup import SectorAggregate
+from src.pipeline.kernels import group_mean, group_stats
 from src.utils.logging import setup_logging
 
 logger = logging.getLogger(__name__)
@@ -17,16 +27,8 @@ logger = logging.getLogger(__name__)
 def load_clean_data() -> pd.DataFrame:
     """Load cleaned data from MongoDB."""
     logger.info("Loading cleaned data...")
-    db = get_database()
-    collection: Collection = db["clean_startups"]
-
-    # Load all documents
-    cursor = collection.find({})
-    df = pd.DataFrame(list(cursor))
-
-    # Remove MongoDB _id field
-    if "_id" in df.columns:
-        df = df.drop(columns=["_id"])
+    df = load_dataframe("clean_startups")
+    df = df.astype(categorical_dtypes(df.columns))
 
     logger.info(f"Loaded {len(df):,} cleaned records")
     return df
@@ -40,105 +42,120 @@ def aggregate_by_sector(df: pd.DataFrame) -> pd.DataFrame:
     if "last_funding_date" in df.columns:
         df["last_funding_date"] = pd.to_datetime(df["last_funding_date"], errors="coerce")
 
-    # Group by sector
-    grouped = df.groupby("sector")
+    grouped = df.groupby("sector", sort=False, observed=True)
+    founded_year = pd.to_numeric(df["founded_year"], errors="coerce").astype("float64")
+
+    # One kernel pass per column over all sectors at once
+    codes, sectors = pd.factorize(df["sector"])
+    n_sectors = len(sectors)
+    active, total_startups, _, _ = group_stats(codes, df["status"].eq("active"), n_sectors)
+    closed, _, _, _ = group_stats(codes, df["status"].eq("closed"), n_sectors)
+    funding_sum, funding_count, _, _ = group_stats(codes, df["total_funding"], n_sectors)
+    _, _, founded_year_min, founded_year_max = group_stats(codes, founded_year, n_sectors)
+
+    stats = pd.DataFrame({
+        "total_startups": total_startups,
+        "active_startups": active.astype(np.int64),
+        "closed_startups": closed.astype(np.int64),
+        "total_funding": funding_sum,
+        "avg_funding": np.divide(
+            funding_sum, funding_count, out=np.full(n_sectors, np.nan), where=funding_count > 0
+        ),
+        "median_funding": grouped["total_funding"].median().reindex(sectors).to_numpy(),
+        "avg_funding_rounds": group_mean(codes, df["funding_rounds"], n_sectors),
+        "avg_time_to_first": (
+            group_mean(codes, df["time_to_first_funding_days"], n_sectors)
+            if "time_to_first_funding_days" in df.columns
+            else np.nan
+        ),
+        "avg_employees": group_mean(codes, df["employee_count"], n_sectors),
+        "founded_year_min": founded_year_min,
+        "founded_year_max": founded_year_max,
+    }, index=pd.Index(sectors, name="sector"))
+
+    # Growth rate: change in startups founded between the first and last of
+    # each sector's final three founding years
+    year_counts = df.groupby([df["sector"], founded_year], sort=False, observed=True).size()
+    first_recent = np.maximum(stats["founded_year_min"], stats["founded_year_max"] - 2)
+    first_counts = year_counts.reindex(
+        pd.MultiIndex.from_arrays([stats.index, first_recent])
+    ).fillna(0).to_numpy()
+    last_counts = year_counts.reindex(
+        pd.MultiIndex.from_arrays([stats.index, stats["founded_year_max"]])
+    ).fillna(0).to_numpy()
+    has_span = (stats["founded_year_max"] > stats["founded_year_min"]).to_numpy()
+    stats["growth_rate"] = np.where(
+        has_span & (first_counts > 0),
+        (last_counts - first_counts) / np.where(first_counts > 0, first_counts, 1),
+        0.0,
+    )
+
+    # Saturation score (based on competition density)
+    # Higher number of startups in sector = higher saturation
+    max_startups_in_sector = stats["total_startups"].max()
+    if max_startups_in_sector > 0:
+        stats["saturation_score"] = (stats["total_startups"] / max_startups_in_sector).clip(upper=1.0)
+    else:
+        stats["saturation_score"] = 0.0
+
+    # Risk score (based on failure rate)
+    stats["risk_score"] = stats["closed_startups"] / stats["total_startups"]
+
+    # Top countries and capital distribution, from one (sector, value) count each
+    # Key-sorted counts + a stable sort keep ties in country-name order,
+    # independent of row order
+    country_counts = df.groupby(["sector", "country"], observed=True).size()
+    country_counts = country_counts[country_counts > 0].sort_values(ascending=False, kind="stable")
+    top_countries = (
+        country_counts.groupby(level="sector", sort=False, observed=True).head(5)
+        .reset_index(level="country")["country"]
+        .groupby(level="sector", sort=False, observed=True).agg(list)
+    )
+    capital_counts = df.groupby(["sector", "capital_range"], sort=False, observed=True).size()
+    capital_distribution = capital_counts.unstack(fill_value=0).to_dict("index")
+    stats["top_countries"] = [top_countries.get(sector, []) for sector in stats.index]
+    stats["capital_distribution"] = [capital_distribution.get(sector, {}) for sector in stats.index]
 
     aggregated_data: list[dict[str, Any]] = []
 
-    for sector, group_df in grouped:
-        # Basic counts
-        total_startups = len(group_df)
-        active_startups = len(group_df[group_df["status"] == "active"])
-        closed_startups = len(group_df[group_df["status"] == "closed"])
-
-        # Funding metrics
-        total_funding = group_df["total_funding"].sum()
-        avg_funding = group_df["total_funding"].mean() if total_startups > 0 else 0.0
-        median_funding = group_df["total_funding"].median() if total_startups > 0 else 0.0
-        avg_funding_rounds = group_df["funding_rounds"].mean() if total_startups > 0 else 0.0
-
-        # Time metrics
-        avg_time_to_first = (
-            group_df["time_to_first_funding_days"].mean()
-            if "time_to_first_funding_days" in group_df.columns
-            else None
+    for row in stats.itertuples(name="Sector"):
+        founded_year_min = int(row.founded_year_min) if pd.notna(row.founded_year_min) else None
+        founded_year_max = int(row.founded_year_max) if pd.notna(row.founded_year_max) else None
+        year_span = (
+            founded_year_max - founded_year_min if founded_year_min is not None else None
         )
-        if pd.isna(avg_time_to_first):
-            avg_time_to_first = None
-
-        # Employee metrics
-        avg_employees = group_df["employee_count"].mean() if total_startups > 0 else None
-        if pd.isna(avg_employees):
-            avg_employees = None
-
-        # Founding year range
-        founded_years = group_df["founded_year"].dropna()
-        founded_year_min = int(founded_years.min()) if len(founded_years) > 0 else None
-        founded_year_max = int(founded_years.max()) if len(founded_years) > 0 else None
-
-        # Growth rate (year-over-year startup count growth)
-        if founded_year_min and founded_year_max and founded_year_max > founded_year_min:
-            years = list(range(founded_year_min, founded_year_max + 1))
-            if len(years) >= 2:
-                startups_by_year = group_df.groupby("founded_year").size()
-                if len(startups_by_year) >= 2:
-                    recent_years = sorted(years)[-3:]  # Last 3 years
-                    recent_counts = [startups_by_year.get(y, 0) for y in recent_years]
-                    if recent_counts[0] > 0:
-                        growth_rate = (recent_counts[-1] - recent_counts[0]) / recent_counts[0]
-                    else:
-                        growth_rate = 0.0
-                else:
-                    growth_rate = 0.0
-            else:
-                growth_rate = 0.0
-        else:
-            growth_rate = 0.0
-
-        # Saturation score (based on competition density)
-        # Higher number of startups in sector = higher saturation
-        max_startups_in_sector = df.groupby("sector").size().max()
-        saturation_score = min(1.0, total_startups / max_startups_in_sector) if max_startups_in_sector > 0 else 0.0
-
-        # Risk score (based on failure rate)
-        failure_rate = closed_startups / total_startups if total_startups > 0 else 0.0
-        risk_score = failure_rate
-
-        # Top countries
-        country_counts = group_df["country"].value_counts().head(5)
-        top_countries = country_counts.index.tolist()
-
-        # Capital distribution
-        capital_dist = group_df["capital_range"].value_counts().to_dict()
 
         sector_data = {
-            "sector": sector,
-            "total_startups": int(total_startups),
-            "active_startups": int(active_startups),
-            "closed_startups": int(closed_startups),
-            "total_funding": float(total_funding),
-            "avg_funding_per_startup": float(avg_funding),
-            "median_funding": float(median_funding),
-            "avg_funding_rounds": float(avg_funding_rounds),
+            "sector": row.Index,
+            "total_startups": int(row.total_startups),
+            "active_startups": int(row.active_startups),
+            "closed_startups": int(row.closed_startups),
+            "total_funding": float(row.total_funding),
+            "avg_funding_per_startup": float(row.avg_funding),
+            "median_funding": float(row.median_funding),
+            "avg_funding_rounds": float(row.avg_funding_rounds),
             "avg_time_to_first_funding_days": (
-                float(avg_time_to_first) if avg_time_to_first is not None else None
+                float(row.avg_time_to_first) if pd.notna(row.avg_time_to_first) else None
+            ),
+            "avg_employee_count": (
+                float(row.avg_employees) if pd.notna(row.avg_employees) else None
             ),
-            "avg_employee_count": float(avg_employees) if avg_employees is not None else None,
             "founded_year_min": founded_year_min,
             "founded_year_max": founded_year_max,
-            "growth_rate": float(growth_rate),
-            "saturation_score": float(saturation_score),
-            "risk_score": float(risk_score),
-            "top_countries": top_countries,
-            "capital_distribution": capital_dist,
+            "year_span": year_span,
+            "growth_rate": float(row.growth_rate),
+            "saturation_score": float(row.saturation_score),
+            "risk_score": float(row.risk_score),
+            "top_countries": row.top_countries,
+            "capital_distribution": row.capital_distribution,
         }
 
         # Validate with Pydantic
         try:
             validated = SectorAggregate(**sector_data)
             aggregated_data.append(validated.model_dump())
-        except Exception as e:
-            logger.warning(f"Validation error for sector {sector}: {e}")
+        except ValidationError as e:
+            logger.warning("Validation error for sector %s: %s", row.Index, e)
 
     df_aggregated = pd.DataFrame(aggregated_data)
     logger.info(f"Aggregated {len(df_aggregated)} sectors")
@@ -150,8 +167,8 @@ def save_aggregated_data(df: pd.DataFrame) -> int:
     """Save aggregated data to MongoDB."""
     logger.info("Saving aggregated data...")
 
-    # Convert DataFrame to list of dictionaries
-    documents = df.replace({pd.NA: None, pd.NaT: None}).to_dict("records")
+    # Stream documents chunk by chunk instead of converting the whole DataFrame
+    documents = iter_documents(df)
 
     # Insert into aggregated collection
     inserted_count = insert_documents("aggregated_sectors", documents)
@@ -165,10 +182,14 @@ def create_indexes() -> None:
     logger.info("Creating indexes...")
     db = get_database()
     collection = db["aggregated_sectors"]
-    collection.create_index("sector", unique=True)
-    collection.create_index("total_startups")
-    collection.create_index("growth_rate")
-    collection.create_index("risk_score")
+    # One createIndexes round-trip for all of them
+    collection.create_indexes([
+        IndexModel([("sector", ASCENDING)], unique=True),
+        IndexModel([("total_startups", ASCENDING)]),
+        IndexModel([("growth_rate", ASCENDING)]),
+        IndexModel([("risk_score", ASCENDING)]),
+        IndexModel([("year_span", DESCENDING)]),
+    ])
 
     logger.info("Indexes created successfully")
 
@@ -186,9 +207,9 @@ def show_aggregated_collection_info() -> None:
     if samples:
         logger.info("\nSample Aggregated Documents:")
         for i, sample in enumerate(samples, 1):
-            logger.info(f"\nSample {i}:")
+            logger.info("\nSample %d:", i)
             for key, value in list(sample.items())[:15]:
-                logger.info(f"  {key}: {value} ({type(value).__name__})")
+                logger.info("  %s: %s (%s)", key, value, type(value).__name__)
 
 
 def main() -> None:
@@ -1,40 +1,50 @@
 """Data cleaning."""
 
 import logging
-from datetime import datetime
-from typing import Any
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 
+import numpy as np
 import pandas as pd
-from pymongo.collection import Collection
-
-from src.database.connection import get_database
-from src.database.operations import insert_documents, count_documents, get_schema_sample
-from src.models.startup import StartupRaw, StartupClean
+from pydantic import TypeAdapter, ValidationError
+
+from src.database.operations import (
+    count_documents,
+    get_schema_sample,
+    insert_dataframe,
+    load_dataframe,
+)
+from src.models.schema import (
+    CAPITAL_RANGE_BINS,
+    CAPITAL_RANGES,
+    STARTUP_SCHEMA,
+    categorical_dtypes,
+    validate_df,
+)
+from src.models.startup import StartupClean
+from src.utils.config import get_config
 from src.utils.logging import setup_logging
 
 logger = logging.getLogger(__name__)
 
+CLEAN_RECORDS_ADAPTER = TypeAdapter(list[StartupClean])
+
+# Smaller frames are validated in-process; worker startup would dominate
+PARALLEL_MIN_ROWS = 100_000
+
 
 def load_raw_data() -> pd.DataFrame:
     """Load raw data from MongoDB."""
     logger.info("Loading raw data...")
-    db = get_database()
-    collection: Collection = db["raw_startups"]
-
-    # Load all documents
-    cursor = collection.find({})
-    df = pd.DataFrame(list(cursor))
-
-    # Remove MongoDB _id field
-    if "_id" in df.columns:
-        df = df.drop(columns=["_id"])
+    df = load_dataframe("raw_startups", schema=STARTUP_SCHEMA)
 
     logger.info(f"Loaded {len(df):,} raw records")
     return df
 
 
-def clean_data(df: pd.DataFrame) -> pd.DataFrame:
-    """Clean and transform data."""
+def clean_data(df: pd.DataFrame, workers: Optional[int] = None) -> pd.DataFrame:
+    """Clean and transform data, validating across worker processes."""
     logger.info("Cleaning data...")
     initial_count = len(df)
 
@@ -51,13 +61,16 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     text_cols = ["name", "sector", "status", "country", "city"]
     for col in text_cols:
         if col in df.columns:
-            df[col] = df[col].astype(str).str.strip()
-            # Replace 'nan' strings with placeholder for required fields
+            # Arrow-backed strings run the .str methods as Arrow UTF-8 kernels
+            text = df[col].astype("string[pyarrow]").str.strip()
+            # Replace missing values with placeholder for required fields
             if col in ["name", "sector"]:
-                df[col] = df[col].replace("nan", "Unknown")
-                df[col] = df[col].replace("", "Unknown")
+                text = text.fillna("Unknown").replace("", "Unknown")
+                placeholder = "Unknown"
             else:
-                df[col] = df[col].replace("nan", "")
+                text = text.fillna("")
+                placeholder = ""
+            df[col] = text.mask(text.str.lower().eq("nan"), placeholder)
 
     # Normalize sector
     if "sector" in df.columns:
@@ -71,10 +84,9 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     # Standardize dates
     logger.info("Standardizing dates...")
     if "last_funding_date" in df.columns:
-        # Convert to string first if needed, then to datetime
-        df["last_funding_date"] = df["last_funding_date"].astype(str)
+        # ISO dates parse in one vectorized pass; missing values become NaT
         df["last_funding_date"] = pd.to_datetime(
-            df["last_funding_date"], errors="coerce"
+            df["last_funding_date"], errors="coerce", format="ISO8601"
         )
 
     # Filter out invalid records before deduplication
@@ -96,87 +108,41 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     # Add derived fields
     logger.info("Adding derived fields...")
 
-    def categorize_funding_stage(row: pd.Series) -> str:
-        """Categorize funding stage."""
-        rounds = row.get("funding_rounds", 0) or 0
-        total = row.get("total_funding", 0) or 0
-
-        if rounds == 0 or total == 0:
-            return "pre-seed"
-        elif rounds == 1:
-            return "seed"
-        elif rounds == 2:
-            return "series-a"
-        elif rounds == 3:
-            return "series-b"
-        elif rounds >= 4:
-            return "series-c-plus"
-        else:
-            return "unknown"
-
-    df["funding_stage"] = df.apply(categorize_funding_stage, axis=1)
-
-    def categorize_capital_range(row: pd.Series) -> str:
-        """Categorize capital range."""
-        total = row.get("total_funding", 0) or 0
-
-        if total == 0:
-            return "0-0"
-        elif total < 1000000:
-            return "0-1M"
-        elif total < 10000000:
-            return "1M-10M"
-        elif total < 50000000:
-            return "10M-50M"
-        else:
-            return "50M+"
-
-    df["capital_range"] = df.apply(categorize_capital_range, axis=1)
-
-    # Validate with Pydantic
+    rounds = df["funding_rounds"].fillna(0).to_numpy()
+    total = df["total_funding"].fillna(0).to_numpy()
+
+    df["funding_stage"] = np.select(
+        [(rounds == 0) | (total == 0), rounds == 1, rounds == 2, rounds == 3, rounds >= 4],
+        ["pre-seed", "seed", "series-a", "series-b", "series-c-plus"],
+        default="unknown",
+    )
+    df["capital_range"] = pd.cut(
+        total, bins=CAPITAL_RANGE_BINS, labels=CAPITAL_RANGES, right=False
+    )
+
+    # Validate raw field constraints column-at-a-time with Arrow
     logger.info("Validating data...")
-    clean_records: list[dict[str, Any]] = []
-    validation_errors = 0
-
-    for _, row in df.iterrows():
-        try:
-            # Convert row to dict, handling NaN
-            row_dict = row.replace({pd.NA: None, pd.NaT: None}).to_dict()
-            
-            # Convert datetime to string for validation
-            if "last_funding_date" in row_dict and pd.notna(row_dict["last_funding_date"]):
-                row_dict["last_funding_date"] = str(row_dict["last_funding_date"])[:10]
-            elif "last_funding_date" in row_dict:
-                row_dict["last_funding_date"] = None
-
-            # Validate with raw model first
-            raw_model = StartupRaw(**row_dict)
-
-            # Convert to clean model
-            clean_dict = raw_model.model_dump()
-            clean_dict["funding_stage"] = row.get("funding_stage", "unknown")
-            clean_dict["capital_range"] = row.get("capital_range", "unknown")
-
-            # Convert datetime to string for MongoDB
-            if clean_dict.get("last_funding_date"):
-                if isinstance(clean_dict["last_funding_date"], datetime):
-                    clean_dict["last_funding_date"] = clean_dict["last_funding_date"].isoformat()
-
-            clean_model = StartupClean(**clean_dict)
-            clean_records.append(clean_model.model_dump())
-        except Exception as e:
-            validation_errors += 1
-            if validation_errors <= 10:  # Log first 10 errors
-                logger.warning(f"Validation error for record {row.get('name', 'unknown')}: {e}")
-            elif validation_errors == 100:
-                logger.warning(f"...100 validation errors so far...")
-            elif validation_errors % 10000 == 0:
-                logger.warning(f"...{validation_errors:,} validation errors so far...")
-
-    logger.info(f"Validated {len(clean_records):,} records ({validation_errors:,} errors)")
-
-    # Convert back to DataFrame
-    df_clean = pd.DataFrame(clean_records)
+    valid = validate_df(df)
+    validation_errors = int((~valid).sum())
+    df = df[valid]
+
+    # Validate with Pydantic, one partition per worker process for large frames
+    if workers is None:
+        workers = get_config().pipeline_workers or os.cpu_count() or 1
+    if workers > 1 and len(df) >= PARALLEL_MIN_ROWS:
+        partitions = [df.iloc[rows] for rows in np.array_split(np.arange(len(df)), workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(validate_records, partitions))
+        df_clean = pd.concat([part for part, _ in results], ignore_index=True)
+        validation_errors += sum(errors for _, errors in results)
+    else:
+        df_clean, errors = validate_records(df)
+        validation_errors += errors
+
+    logger.info(f"Validated {len(df_clean):,} records ({validation_errors:,} errors)")
+
+    # Small fixed vocabularies: compare and group on integer category codes
+    df_clean = df_clean.astype(categorical_dtypes(df_clean.columns))
 
     logger.info(
         f"Cleaning complete: {initial_count:,} -> {len(df_clean):,} records "
@@ -186,15 +152,40 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     return df_clean
 
 
+def validate_records(df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    """Validate records with StartupClean in one call; returns clean records and error count."""
+    if "last_funding_date" in df.columns:
+        df = df.assign(last_funding_date=df["last_funding_date"].dt.strftime("%Y-%m-%d"))
+    # StartupClean forbids extra fields; keep only the columns it models
+    df = df[[col for col in StartupClean.model_fields if col in df.columns]]
+    records = df.astype(object).where(df.notna(), None).to_dict("records")
+
+    try:
+        clean_models = CLEAN_RECORDS_ADAPTER.validate_python(records)
+        validation_errors = 0
+    except ValidationError as e:
+        # Drop the failing records and validate the rest again
+        invalid: dict[int, str] = {}
+        for error in e.errors():
+            field = ".".join(str(part) for part in error["loc"][1:])
+            invalid.setdefault(error["loc"][0], f"{field}: {error['msg']}")
+        for index, message in list(invalid.items())[:10]:  # Log first 10 errors
+            logger.warning("Validation error for record %s: %s", records[index]["name"], message)
+        validation_errors = len(invalid)
+        records = [record for i, record in enumerate(records) if i not in invalid]
+        clean_models = CLEAN_RECORDS_ADAPTER.validate_python(records)
+
+    # One serializer call for the whole list instead of model_dump per record
+    clean_records = CLEAN_RECORDS_ADAPTER.dump_python(clean_models)
+    return pd.DataFrame(clean_records), validation_errors
+
+
 def save_clean_data(df: pd.DataFrame) -> int:
     """Save cleaned data to MongoDB."""
     logger.info("Saving cleaned data...")
 
-    # Convert DataFrame to list of dictionaries
-    documents = df.replace({pd.NA: None, pd.NaT: None}).to_dict("records")
-
     # Insert into clean collection
-    inserted_count = insert_documents("clean_startups", documents)
+    inserted_count = insert_dataframe("clean_startups", df)
 
     logger.info(f"Successfully saved {inserted_count:,} cleaned documents")
     return inserted_count
@@ -213,9 +204,9 @@ def show_clean_collection_info() -> None:
     if samples:
         logger.info("\nSample Cleaned Documents:")
         for i, sample in enumerate(samples, 1):
-            logger.info(f"\nSample {i}:")
+            logger.info("\nSample %d:", i)
             for key, value in list(sample.items())[:10]:
-                logger.info(f"  {key}: {value} ({type(value).__name__})")
+                logger.info("  %s: %s (%s)", key, value, type(value).__name__)
 
 
 def main() -> None:
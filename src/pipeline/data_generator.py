@@ -1,164 +1,197 @@
 """Generate synthetic startup data for testing and demonstration."""
 
-import random
 import logging
-from datetime import datetime, timedelta
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Callable, Final, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from src.models.schema import SECTORS, STATUSES
 
 logger = logging.getLogger(__name__)
 
 # Sample data for realistic generation
-SECTORS = [
-    "Technology",
-    "Healthcare",
-    "Finance",
-    "E-commerce",
-    "Education",
-    "Real Estate",
-    "Transportation",
-    "Energy",
-    "Food & Beverage",
-    "Entertainment",
-    "Manufacturing",
-    "Agriculture",
-    "Retail",
-    "Telecommunications",
-    "Media",
-    "Consulting",
-    "Travel",
-    "Fitness",
-    "Legal",
-    "Construction",
-]
-
-STATUSES = ["active", "closed", "acquired", "ipo", "unknown"]
-
-COUNTRIES = ["USA", "UK", "Canada", "Germany", "France", "India", "China", "Australia", "Japan", "Brazil"]
-
-CITIES = {
-    "USA": ["San Francisco", "New York", "Austin", "Seattle", "Boston", "Los Angeles"],
-    "UK": ["London", "Manchester", "Edinburgh"],
-    "Canada": ["Toronto", "Vancouver", "Montreal"],
-    "Germany": ["Berlin", "Munich", "Hamburg"],
-    "France": ["Paris", "Lyon", "Marseille"],
-    "India": ["Bangalore", "Mumbai", "Delhi"],
-    "China": ["Beijing", "Shanghai", "Shenzhen"],
-    "Australia": ["Sydney", "Melbourne"],
-    "Japan": ["Tokyo", "Osaka"],
-    "Brazil": ["São Paulo", "Rio de Janeiro"],
+COUNTRIES: Final[tuple[str, ...]] = (
+    "USA", "UK", "Canada", "Germany", "France", "India", "China", "Australia", "Japan", "Brazil",
+)
+
+CITIES: Final[dict[str, tuple[str, ...]]] = {
+    "USA": ("San Francisco", "New York", "Austin", "Seattle", "Boston", "Los Angeles"),
+    "UK": ("London", "Manchester", "Edinburgh"),
+    "Canada": ("Toronto", "Vancouver", "Montreal"),
+    "Germany": ("Berlin", "Munich", "Hamburg"),
+    "France": ("Paris", "Lyon", "Marseille"),
+    "India": ("Bangalore", "Mumbai", "Delhi"),
+    "China": ("Beijing", "Shanghai", "Shenzhen"),
+    "Australia": ("Sydney", "Melbourne"),
+    "Japan": ("Tokyo", "Osaka"),
+    "Brazil": ("São Paulo", "Rio de Janeiro"),
 }
 
+# Arrow dictionaries for the categorical columns; rows hold integer codes
+_SECTOR_VALUES = pa.array(SECTORS)
+_STATUS_VALUES = pa.array(STATUSES)
+_COUNTRY_VALUES = pa.array(COUNTRIES)
+# Cities of all countries back to back; country i starts at _CITY_OFFSETS[i]
+_CITY_VALUES = pa.array([city for country in COUNTRIES for city in CITIES[country]])
+_CITY_COUNTS = np.array([len(CITIES[country]) for country in COUNTRIES])
+_CITY_OFFSETS = np.concatenate([[0], np.cumsum(_CITY_COUNTS)[:-1]])
+
+GENERATOR_THREADS = min(8, os.cpu_count() or 1)
 
-def generate_startup_data(num_records: int = 1000000) -> pd.DataFrame:
+
+def generate_startup_data(num_records: int = 1000000, seed: Optional[int] = None) -> pd.DataFrame:
     """Generate synthetic startup data."""
     logger.info(f"Generating {num_records:,} records...")
 
-    data: list[dict[str, Any]] = []
-
-    for i in range(num_records):
-        # Basic info
-        name = f"Startup_{i+1:06d}"
-        sector = random.choice(SECTORS)
-        country = random.choice(COUNTRIES)
-        city = random.choice(CITIES.get(country, ["Unknown"]))
-
-        # Founding year (2010-2023)
-        founded_year = random.randint(2010, 2023)
-        founded_date = datetime(founded_year, random.randint(1, 12), random.randint(1, 28))
-
-        # Funding information
-        has_funding = random.random() > 0.2  # 80% have funding
-        if has_funding:
-            funding_rounds = random.randint(1, 8)
-            # Total funding based on rounds and sector
-            base_funding = random.uniform(10000, 50000000)
-            total_funding = base_funding * (1 + funding_rounds * 0.3)
-
-            # First funding date (within 2 years of founding)
-            first_funding_date = founded_date + timedelta(days=random.randint(0, 730))
-            first_funding_year = first_funding_date.year
-
-            # Last funding date
-            if funding_rounds > 1:
-                last_funding_date = first_funding_date + timedelta(
-                    days=random.randint(90, 365 * 3)
-                )
-            else:
-                last_funding_date = first_funding_date
-            last_funding_year = last_funding_date.year
-
-            time_to_first_funding = (first_funding_date - founded_date).days
-            time_to_last_funding = (last_funding_date - founded_date).days
-        else:
-            funding_rounds = 0
-            total_funding = 0.0
-            first_funding_year = None
-            last_funding_year = None
-            last_funding_date = None
-            time_to_first_funding = None
-            time_to_last_funding = None
-
-        # Status (correlated with funding and age)
-        if not has_funding:
-            status = random.choice(["closed", "unknown"])
-        elif founded_year < 2015:
-            status = random.choices(
-                ["active", "closed", "acquired", "ipo"],
-                weights=[0.4, 0.3, 0.2, 0.1],
-            )[0]
-        else:
-            status = random.choices(
-                ["active", "closed", "acquired"],
-                weights=[0.7, 0.2, 0.1],
-            )[0]
-
-        # Employee count (correlated with funding)
-        if total_funding > 0:
-            max_employees = max(2, int(min(1000, total_funding / 50000)))
-            employee_count = random.randint(1, max_employees)
-        else:
-            employee_count = random.randint(1, 20)
-
-        record = {
-            "name": name,
-            "sector": sector,
-            "founded_year": founded_year,
-            "funding_rounds": funding_rounds if has_funding else None,
-            "total_funding": round(total_funding, 2) if has_funding else None,
-            "last_funding_date": last_funding_date.strftime("%Y-%m-%d") if last_funding_date else None,
-            "status": status,
-            "country": country,
-            "city": city,
-            "employee_count": employee_count,
-            "first_funding_year": first_funding_year,
-            "last_funding_year": last_funding_year,
-            "time_to_first_funding_days": time_to_first_funding,
-            "time_to_last_funding_days": time_to_last_funding,
-        }
-
-        data.append(record)
-
-        if (i + 1) % 100000 == 0:
-            logger.info(f"Generated {i+1:,} records...")
-
-    df = pd.DataFrame(data)
+    n = num_records
+    draws = _draw_columns(n, seed)
+
+    # Basic info
+    # Names are built and kept in one Arrow string buffer, not 1M Python str objects
+    ids = pc.cast(pa.array(np.arange(1, n + 1)), pa.string())
+    names = pc.binary_join_element_wise("Startup_", pc.utf8_lpad(ids, 6, "0"), "")
+    sector_codes = draws["sector_codes"]
+    country_codes = draws["country_codes"]
+    # Uniform city within each row's country
+    city_codes = (draws["city_uniform"] * _CITY_COUNTS[country_codes]).astype(np.int64)
+    city_codes += _CITY_OFFSETS[country_codes]
+
+    # Founding year (2010-2023)
+    founded_years = draws["founded_years"]
+    # Epoch arithmetic: year -> month -> day, no date parsing
+    founded_months = (founded_years - 1970).astype("datetime64[Y]").astype("datetime64[M]")
+    founded_months += draws["founded_month_offsets"].astype("timedelta64[M]")
+    founded_dates = founded_months.astype("datetime64[D]")
+    founded_dates += draws["founded_day_offsets"].astype("timedelta64[D]")
+
+    # Funding information
+    has_funding = draws["funding_uniform"] > 0.2  # 80% have funding
+    funding_rounds = draws["funding_rounds"]
+    # Total funding based on rounds and sector
+    total_funding = draws["base_funding"] * (1 + funding_rounds * 0.3)
+
+    # First funding date (within 2 years of founding)
+    first_funding_dates = founded_dates + draws["first_funding_days"].astype("timedelta64[D]")
+
+    # Last funding date
+    later_rounds_days = np.where(funding_rounds > 1, draws["later_rounds_days"], 0)
+    last_funding_dates = first_funding_dates + later_rounds_days.astype("timedelta64[D]")
+
+    time_to_first_funding = (first_funding_dates - founded_dates).astype(int)
+    time_to_last_funding = (last_funding_dates - founded_dates).astype(int)
+
+    # Status (correlated with funding and age)
+    # Codes index STATUSES: active, closed, acquired, ipo, unknown
+    status_codes = np.select(
+        [~has_funding, founded_years < 2015],
+        [draws["unfunded_status"], draws["early_status"]],
+        default=draws["recent_status"],
+    )
+
+    # Employee count (correlated with funding): uniform in 1..max_employees
+    max_employees = np.maximum(2, np.minimum(1000, total_funding / 50000).astype(int))
+    employee_counts = np.where(
+        has_funding,
+        1 + (draws["employee_uniform"] * max_employees).astype(np.int64),
+        draws["unfunded_employees"],
+    )
+
+    # Columnar Arrow table; categorical columns become pandas categoricals
+    # that share one dictionary instead of a Python string per cell
+    table = pa.table({
+        "sector": _dictionary(sector_codes, _SECTOR_VALUES),
+        "founded_year": founded_years,
+        "funding_rounds": np.where(has_funding, funding_rounds, np.nan),
+        "total_funding": np.where(has_funding, np.round(total_funding, 2), np.nan),
+        "last_funding_date": np.where(
+            has_funding, np.datetime_as_string(last_funding_dates, unit="D"), None
+        ),
+        "status": _dictionary(status_codes, _STATUS_VALUES),
+        "country": _dictionary(country_codes, _COUNTRY_VALUES),
+        "city": _dictionary(city_codes, _CITY_VALUES),
+        "employee_count": employee_counts,
+        "first_funding_year": np.where(has_funding, _years(first_funding_dates), np.nan),
+        "last_funding_year": np.where(has_funding, _years(last_funding_dates), np.nan),
+        "time_to_first_funding_days": np.where(has_funding, time_to_first_funding, np.nan),
+        "time_to_last_funding_days": np.where(has_funding, time_to_last_funding, np.nan),
+    })
+    df = table.to_pandas()
+    df.insert(0, "name", pd.arrays.ArrowStringArray(names))
+    # Narrowest dtypes that hold each column's range; float32 columns are
+    # small whole numbers with NaN for unfunded startups. total_funding keeps
+    # float64 to stay exact to the cent.
+    df = df.astype({
+        "founded_year": "int16",
+        "funding_rounds": "float32",
+        "employee_count": "uint16",
+        "first_funding_year": "float32",
+        "last_funding_year": "float32",
+        "time_to_first_funding_days": "float32",
+        "time_to_last_funding_days": "float32",
+    })
+
     logger.info(f"Generated {len(df):,} records with {len(df.columns)} columns")
     return df
 
 
-def save_data(df: pd.DataFrame, output_path: Path, format: str = "csv") -> None:
+def _draw_columns(n: int, seed: Optional[int]) -> dict[str, np.ndarray]:
+    """Draw every random column from its own child stream, in parallel threads.
+
+    SeedSequence.spawn gives each column an independent stream, so results
+    are reproducible for a seed regardless of thread scheduling.
+    """
+    draws: dict[str, Callable[[np.random.Generator], np.ndarray]] = {
+        "sector_codes": lambda rng: rng.integers(0, len(SECTORS), size=n),
+        "country_codes": lambda rng: rng.integers(0, len(COUNTRIES), size=n),
+        "city_uniform": lambda rng: rng.random(n),
+        "founded_years": lambda rng: rng.integers(2010, 2024, size=n),
+        "founded_month_offsets": lambda rng: rng.integers(0, 12, size=n),
+        "founded_day_offsets": lambda rng: rng.integers(0, 28, size=n),
+        "funding_uniform": lambda rng: rng.random(n),
+        "funding_rounds": lambda rng: rng.integers(1, 9, size=n),
+        "base_funding": lambda rng: rng.uniform(10000, 50000000, size=n),
+        "first_funding_days": lambda rng: rng.integers(0, 731, size=n),
+        "later_rounds_days": lambda rng: rng.integers(90, 365 * 3 + 1, size=n),
+        "unfunded_status": lambda rng: rng.choice([1, 4], size=n),
+        "early_status": lambda rng: rng.choice([0, 1, 2, 3], size=n, p=[0.4, 0.3, 0.2, 0.1]),
+        "recent_status": lambda rng: rng.choice([0, 1, 2], size=n, p=[0.7, 0.2, 0.1]),
+        "employee_uniform": lambda rng: rng.random(n),
+        "unfunded_employees": lambda rng: rng.integers(1, 21, size=n),
+    }
+    rngs = [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(len(draws))]
+
+    # NumPy releases the GIL while filling large arrays
+    with ThreadPoolExecutor(max_workers=GENERATOR_THREADS) as executor:
+        columns = executor.map(lambda draw, rng: draw(rng), draws.values(), rngs)
+        return dict(zip(draws, columns))
+
+
+def _dictionary(codes: np.ndarray, values: pa.Array) -> pa.DictionaryArray:
+    """Dictionary-encoded column from integer codes into values."""
+    return pa.DictionaryArray.from_arrays(codes.astype(np.int32), values)
+
+
+def _years(dates: np.ndarray) -> np.ndarray:
+    """Calendar years of a datetime64 array."""
+    return dates.astype("datetime64[Y]").astype(int) + 1970
+
+
+def save_data(df: pd.DataFrame, output_path: Path, format: str = "parquet") -> None:
     """Save DataFrame to file."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if format.lower() == "csv":
+    if format.lower() == "parquet":
+        df.to_parquet(output_path, compression="zstd", engine="pyarrow", index=False)
+    elif format.lower() == "csv":
         df.to_csv(output_path, index=False)
     elif format.lower() == "json":
         df.to_json(output_path, orient="records", lines=True)
-    elif format.lower() == "parquet":
-        df.to_parquet(output_path, index=False)
     else:
         raise ValueError(f"Unsupported format: {format}")
     
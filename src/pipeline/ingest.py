@@ -2,13 +2,17 @@
 
 import logging
 from pathlib import Path
-from typing import Any
 
 import pandas as pd
+import pyarrow as pa
 from pymongo.collection import Collection
 
 from src.database.connection import get_database
-from src.database.operations import insert_documents, count_documents, get_schema_sample
+from src.database.operations import (
+    count_documents,
+    get_schema_sample,
+    insert_dataframe,
+)
 from src.pipeline.data_generator import generate_startup_data, save_data
 from src.utils.config import get_config
 from src.utils.logging import setup_logging
@@ -20,12 +24,19 @@ def load_data_from_file(file_path: Path) -> pd.DataFrame:
     """Load data from file."""
     logger.info(f"Loading data from {file_path}")
 
-    if file_path.suffix.lower() == ".csv":
+    if file_path.suffix.lower() == ".parquet":
+        # Keep Arrow dtypes so downstream string/numeric ops stay in Arrow
+        df = pd.read_parquet(file_path, engine="pyarrow", dtype_backend="pyarrow")
+        # Categorical columns come back dictionary-encoded; decode to Arrow strings
+        df = df.astype({
+            col: pd.ArrowDtype(dtype.pyarrow_dtype.value_type)
+            for col, dtype in df.dtypes.items()
+            if pa.types.is_dictionary(dtype.pyarrow_dtype)
+        })
+    elif file_path.suffix.lower() == ".csv":
         df = pd.read_csv(file_path)
     elif file_path.suffix.lower() == ".json":
         df = pd.read_json(file_path, lines=True)
-    elif file_path.suffix.lower() == ".parquet":
-        df = pd.read_parquet(file_path)
     else:
         raise ValueError(f"Unsupported file format: {file_path.suffix}")
 
@@ -37,11 +48,8 @@ def ingest_to_mongodb(df: pd.DataFrame, collection_name: str = "raw_startups") -
     """Ingest data into MongoDB."""
     logger.info(f"Ingesting {len(df):,} records into {collection_name}")
 
-    # Convert to dict format for MongoDB
-    documents = df.replace({pd.NA: None, pd.NaT: None}).to_dict("records")
-
     # Insert documents
-    inserted_count = insert_documents(collection_name, documents)
+    inserted_count = insert_dataframe(collection_name, df)
 
     logger.info(f"Successfully ingested {inserted_count:,} documents")
     return inserted_count
@@ -63,9 +71,9 @@ def show_collection_info(collection_name: str) -> None:
     if samples:
         logger.info("\nSample Documents (Schema):")
         for i, sample in enumerate(samples, 1):
-            logger.info(f"\nSample {i}:")
+            logger.info("\nSample %d:", i)
             for key, value in list(sample.items())[:10]:  # Show first 10 fields
-                logger.info(f"  {key}: {value} ({type(value).__name__})")
+                logger.info("  %s: %s (%s)", key, value, type(value).__name__)
 
     # Show column names
     if samples:
@@ -83,12 +91,12 @@ def main() -> None:
 
     # Check if data file exists, otherwise generate it
     data_dir = config.data_dir / "raw"
-    data_file = data_dir / "startups.csv"
+    data_file = data_dir / "startups.parquet"
 
     if not data_file.exists():
         logger.info("Data file not found. Generating synthetic startup data...")
         df = generate_startup_data(num_records=1000000)
-        save_data(df, data_file, format="csv")
+        save_data(df, data_file, format="parquet")
     else:
         logger.info(f"Loading existing data from {data_file}")
         df = load_data_from_file(data_file)
@@ -0,0 +1,87 @@
+"""Group-by reduction kernels for the sector aggregation.
+
+Rows are grouped by integer codes (from ``pd.factorize``). Each kernel makes
+one pass over a column and returns the per-group sum, count, min and max,
+skipping NaN. When numba is installed the pass is JIT-compiled; otherwise it
+falls back to NumPy bincount and ufunc ``at`` reductions.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+def _group_stats_numpy(
+    codes: np.ndarray, values: np.ndarray, n_groups: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Per-group sum, count, min and max of values, skipping NaN and code -1."""
+    keep = (codes >= 0) & ~np.isnan(values)
+    codes = codes[keep]
+    values = values[keep]
+
+    sums = np.bincount(codes, weights=values, minlength=n_groups)
+    counts = np.bincount(codes, minlength=n_groups)
+    mins = np.full(n_groups, np.inf)
+    maxs = np.full(n_groups, -np.inf)
+    np.minimum.at(mins, codes, values)
+    np.maximum.at(maxs, codes, values)
+    return sums, counts, mins, maxs
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _group_stats_jit(
+        codes: np.ndarray, values: np.ndarray, n_groups: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Per-group sum, count, min and max of values in a single pass."""
+        sums = np.zeros(n_groups)
+        counts = np.zeros(n_groups, dtype=np.int64)
+        mins = np.full(n_groups, np.inf)
+        maxs = np.full(n_groups, -np.inf)
+        for i in range(codes.shape[0]):
+            code = codes[i]
+            value = values[i]
+            if code < 0 or np.isnan(value):
+                continue
+            sums[code] += value
+            counts[code] += 1
+            if value < mins[code]:
+                mins[code] = value
+            if value > maxs[code]:
+                maxs[code] = value
+        return sums, counts, mins, maxs
+
+else:
+    _group_stats_jit = None
+
+
+def group_stats(
+    codes: np.ndarray, values: np.ndarray, n_groups: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return per-group (sum, count, min, max) of values, skipping NaN.
+
+    codes are group numbers in ``range(n_groups)``, with -1 for rows that
+    belong to no group. min and max are NaN for groups without values.
+    """
+    codes = np.ascontiguousarray(codes, dtype=np.int64)
+    values = np.ascontiguousarray(values, dtype=np.float64)
+
+    if _group_stats_jit is not None:
+        sums, counts, mins, maxs = _group_stats_jit(codes, values, n_groups)
+    else:
+        sums, counts, mins, maxs = _group_stats_numpy(codes, values, n_groups)
+
+    empty = counts == 0
+    mins[empty] = np.nan
+    maxs[empty] = np.nan
+    return sums, counts, mins, maxs
+
+
+def group_mean(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """Return the per-group mean of values, skipping NaN (NaN for empty groups)."""
+    sums, counts, _, _ = group_stats(codes, values, n_groups)
+    return np.divide(sums, counts, out=np.full(n_groups, np.nan), where=counts > 0)
@@ -0,0 +1,91 @@
+"""Materialized views over the aggregated sector data."""
+
+import logging
+from typing import Any
+
+from bson import ObjectId
+from pymongo.database import Database
+
+from src.database.connection import get_database
+from src.utils.logging import setup_logging
+
+logger = logging.getLogger(__name__)
+
+TOP_SECTORS_PIPELINE: list[dict[str, Any]] = [
+    {"$sort": {"total_funding": -1}},
+    {"$limit": 5},
+    {"$project": {
+        "_id": 0,
+        "sector": 1,
+        "total_funding": 1,
+        "total_startups": 1,
+        "avg_funding_per_startup": 1
+    }}
+]
+
+HIGH_GROWTH_LOW_RISK_PIPELINE: list[dict[str, Any]] = [
+    {
+        "$match": {
+            "growth_rate": {"$gt": 0.1},
+            "risk_score": {"$lt": 0.3}
+        }
+    },
+    {"$sort": {"growth_rate": -1}},
+    {"$project": {
+        "_id": 0,
+        "sector": 1,
+        "growth_rate": 1,
+        "risk_score": 1,
+        "total_startups": 1
+    }}
+]
+
+# year_span is stored by the aggregation, so the sort can walk its index;
+# projecting after the limit shapes only the top 10 documents
+SECTOR_TIMELINE_PIPELINE: list[dict[str, Any]] = [
+    {"$match": {"year_span": {"$ne": None}}},
+    {"$sort": {"year_span": -1}},
+    {"$limit": 10},
+    {"$project": {
+        "sector": 1,
+        "founded_year_min": 1,
+        "founded_year_max": 1,
+        "year_span": 1,
+        "total_startups": 1
+    }}
+]
+
+# View collection -> (pipeline over aggregated_sectors, descending sort field)
+MATERIALIZED_VIEWS: dict[str, tuple[list[dict[str, Any]], str]] = {
+    "mv_top_sectors": (TOP_SECTORS_PIPELINE, "total_funding"),
+    "mv_high_growth_low_risk": (HIGH_GROWTH_LOW_RISK_PIPELINE, "growth_rate"),
+    "mv_sector_timeline": (SECTOR_TIMELINE_PIPELINE, "year_span"),
+}
+
+
+def materialize_views(db: Database) -> None:
+    """Refresh every materialized view from aggregated_sectors with $merge."""
+    refresh_id = ObjectId()
+    for view, (pipeline, sort_field) in MATERIALIZED_VIEWS.items():
+        db["aggregated_sectors"].aggregate([
+            *pipeline,
+            # One document per sector, tagged with this refresh
+            {"$set": {"_id": "$sector", "refresh_id": refresh_id}},
+            {"$merge": {"into": view, "whenMatched": "replace", "whenNotMatched": "insert"}},
+        ])
+        # Sectors that dropped out of the view since the last refresh
+        stale = db[view].delete_many({"refresh_id": {"$ne": refresh_id}})
+        db[view].create_index([(sort_field, -1)])
+        logger.info(f"Refreshed {view} ({stale.deleted_count} stale documents removed)")
+
+
+def main() -> None:
+    setup_logging()
+
+    logger.info("Refreshing materialized views")
+    materialize_views(get_database())
+    logger.info("Materialized views refreshed successfully!")
+
+
+if __name__ == "__main__":
+    main()
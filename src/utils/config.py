@@ -1,8 +1,7 @@
 """Config settings."""
 
-import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
 from pydantic import ConfigDict
 from pydantic_settings import BaseSettings
 
@@ -17,6 +16,17 @@ class Settings(BaseSettings):
     mongodb_password: str = ""
     mongodb_database: str = "startup_analytics"
     mongodb_auth_source: str = "admin"
+    # Wire compression, in preference order; unavailable codecs are skipped
+    mongodb_compressors: str = "zstd,snappy,zlib"
+    mongodb_zlib_level: int = 6
+    # Connection pool and read routing
+    mongodb_max_pool_size: int = 200
+    mongodb_min_pool_size: int = 20
+    mongodb_read_preference: str = "primary"
+    mongodb_max_idle_time_ms: int = 60000
+
+    # Worker processes for pipeline validation; 0 uses every CPU
+    pipeline_workers: int = 0
 
     log_level: str = "INFO"
     data_dir: Path = Path("./data")
@@ -28,14 +38,9 @@ class Settings(BaseSettings):
     )
 
 
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_config() -> Settings:
     """Get config (singleton)."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
 
 
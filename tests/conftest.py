@@ -0,0 +1,35 @@
+"""Shared test fixtures."""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.pipeline import data_generator
+from src.pipeline.data_generator import generate_startup_data, save_data
+
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+
+@pytest.fixture(scope="session")
+def small_df() -> pd.DataFrame:
+    """100 generated startups, shared across the test session."""
+    return generate_startup_data(num_records=100, seed=0)
+
+
+@pytest.fixture(scope="session")
+def big_df() -> pd.DataFrame:
+    """1M generated startups, cached as Parquet and memory-mapped on later runs.
+
+    The cache file is keyed by a hash of the generator source, so editing the
+    generator regenerates it.
+    """
+    source_hash = hashlib.sha256(Path(data_generator.__file__).read_bytes()).hexdigest()[:16]
+    path = CACHE_DIR / f"startups_seed0_1M_{source_hash}.parquet"
+    if not path.exists():
+        partial = path.with_suffix(f".{os.getpid()}.tmp")
+        save_data(generate_startup_data(num_records=1_000_000, seed=0), partial)
+        os.replace(partial, path)
+    return pd.read_parquet(path, engine="pyarrow", memory_map=True)
@@ -3,8 +3,22 @@
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 
-from src.database.connection import get_mongo_client, get_database
-from src.database.operations import count_documents, insert_documents
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from bson.raw_bson import RawBSONDocument
+
+from src.database import operations
+from src.database.connection import RAW_CODEC_OPTIONS, get_mongo_client, get_database
+from src.database.operations import (
+    count_documents,
+    estimated_count,
+    get_schema_sample,
+    insert_dataframe,
+    insert_documents,
+    iter_documents,
+    load_dataframe,
+)
 
 
 @patch("src.database.connection.MongoClient")
@@ -26,9 +40,13 @@ def test_get_database(mock_get_client: Mock) -> None:
     mock_db = Mock()
     mock_client.__getitem__.return_value = mock_db
     mock_get_client.return_value = mock_client
+    get_database.cache_clear()
 
     db = get_database()
     assert db is not None
+    assert get_database() is db
+    mock_get_client.assert_called_once()
+    get_database.cache_clear()
 
 
 @patch("src.database.operations.get_database")
@@ -63,3 +81,136 @@ def test_insert_documents(mock_get_db: Mock) -> None:
     mock_collection.insert_many.assert_called_once()
 
 
+@patch("src.database.connection.get_database")
+def test_get_schema_sample_projection(mock_get_db: Mock) -> None:
+    """Test schema samples forward the projection to the server."""
+    mock_collection = MagicMock()
+    mock_collection.aggregate.return_value = iter([{"sector": "Fintech"}])
+    mock_db = MagicMock()
+    mock_db.__getitem__.return_value = mock_collection
+    mock_get_db.return_value = mock_db
+
+    samples = get_schema_sample("test_collection", 1, projection={"_id": 0})
+
+    assert samples == [{"sector": "Fintech"}]
+    mock_collection.aggregate.assert_called_once_with(
+        [{"$sample": {"size": 1}}, {"$project": {"_id": 0}}], allowDiskUse=False
+    )
+
+
+@patch("src.database.operations.get_database")
+def test_estimated_count(mock_get_db: Mock) -> None:
+    """Test metadata-based document counting."""
+    mock_collection = Mock()
+    mock_collection.estimated_document_count.return_value = 1_000_000
+    mock_db = MagicMock()
+    mock_db.__getitem__.return_value = mock_collection
+    mock_get_db.return_value = mock_db
+
+    assert estimated_count("test_collection") == 1_000_000
+    mock_collection.estimated_document_count.assert_called_once_with()
+    mock_collection.count_documents.assert_not_called()
+
+
+@patch("src.database.operations.get_database")
+def test_insert_documents_from_generator(mock_get_db: Mock) -> None:
+    """Test documents stream from an iterator in fixed-size batches."""
+    mock_collection = Mock()
+    mock_collection.insert_many.side_effect = lambda batch, **kwargs: Mock(
+        inserted_ids=list(range(len(batch)))
+    )
+    mock_db = MagicMock()
+    mock_db.__getitem__.return_value = mock_collection
+    mock_get_db.return_value = mock_db
+
+    documents = ({"name": f"Test{i}"} for i in range(250))
+    inserted = insert_documents("test_collection", documents, batch_size=100)
+
+    assert inserted == 250
+    batch_sizes = [len(c.args[0]) for c in mock_collection.insert_many.call_args_list]
+    assert batch_sizes == [100, 100, 50]
+    # Server-side validation stays on unless the caller opts out
+    assert mock_collection.insert_many.call_args.kwargs == {
+        "ordered": False,
+        "bypass_document_validation": False,
+    }
+
+
+@patch("src.database.connection.get_database")
+def test_get_schema_sample_raw(mock_get_db: Mock) -> None:
+    """Test raw samples are read through a RawBSONDocument collection."""
+    mock_db = MagicMock()
+    mock_db.get_collection.return_value.aggregate.return_value = iter([])
+    mock_get_db.return_value = mock_db
+
+    get_schema_sample("test_collection", 1, raw=True)
+
+    mock_db.get_collection.assert_called_once_with(
+        "test_collection", codec_options=RAW_CODEC_OPTIONS
+    )
+    assert RAW_CODEC_OPTIONS.document_class is RawBSONDocument
+
+
+@patch("src.database.operations.get_database")
+def test_load_dataframe_in_batches(mock_get_db: Mock) -> None:
+    """Test collections load batch by batch, with _id projected away."""
+    mock_collection = MagicMock()
+    mock_collection.find.return_value = iter(
+        [{"name": f"Test{i}", "sector": "Fintech"} for i in range(5)]
+    )
+    mock_db = MagicMock()
+    mock_db.__getitem__.return_value = mock_collection
+    mock_get_db.return_value = mock_db
+
+    df = load_dataframe("test_collection", batch_size=2)
+
+    assert df["name"].tolist() == [f"Test{i}" for i in range(5)]
+    assert df.index.tolist() == list(range(5))
+    mock_collection.find.assert_called_once_with({}, {"_id": 0}, batch_size=2)
+
+
+def test_iter_documents_maps_missing_to_none() -> None:
+    """Test DataFrame rows stream as documents with NaN/NaT stored as None."""
+    df = pd.DataFrame({
+        "name": ["A", "B", "C"],
+        "total_funding": [1.5, np.nan, 3.0],
+        "last_funding_date": pd.to_datetime(["2020-01-01", None, "2021-06-30"]),
+    })
+
+    documents = iter_documents(df, chunk_size=2)
+
+    assert not isinstance(documents, list)
+    assert list(documents) == [
+        {"name": "A", "total_funding": 1.5, "last_funding_date": pd.Timestamp("2020-01-01")},
+        {"name": "B", "total_funding": None, "last_funding_date": None},
+        {"name": "C", "total_funding": 3.0, "last_funding_date": pd.Timestamp("2021-06-30")},
+    ]
+
+
+@patch("src.database.operations.get_database")
+def test_insert_dataframe_writes_arrow(mock_get_db: Mock, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test DataFrames are written as Arrow tables, categoricals decoded."""
+    mock_write = Mock(return_value=Mock(raw_result={"insertedCount": 2}))
+    monkeypatch.setattr(operations, "write_arrow", mock_write)
+    df = pd.DataFrame({"sector": pd.Categorical(["Fintech", "Health"]), "total_funding": [1.0, np.nan]})
+
+    assert insert_dataframe("test_collection", df) == 2
+
+    table = mock_write.call_args.args[1]
+    assert table.schema.field("sector").type == pa.string()
+    assert table.to_pylist() == [
+        {"sector": "Fintech", "total_funding": 1.0},
+        {"sector": "Health", "total_funding": None},
+    ]
+
+
+@patch("src.database.operations.insert_documents")
+def test_insert_dataframe_without_pymongoarrow(
+    mock_insert: Mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test DataFrames fall back to streamed insert_many batches."""
+    monkeypatch.setattr(operations, "write_arrow", None)
+    mock_insert.side_effect = lambda name, documents, **kwargs: len(list(documents))
+
+    assert insert_dataframe("test_collection", pd.DataFrame({"name": ["A", "B"]})) == 2
+    assert mock_insert.call_args.kwargs == {"bypass_validation": True}
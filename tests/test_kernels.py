@@ -0,0 +1,49 @@
+"""Tests for group-by reduction kernels."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipeline import kernels
+from src.pipeline.kernels import group_mean, group_stats
+
+
+def test_group_stats_matches_pandas() -> None:
+    """Test per-group sum, count, min and max skip NaN like pandas."""
+    codes = np.array([0, 1, 0, 2, 1, 0, -1])
+    values = np.array([1.0, 5.0, np.nan, np.nan, 3.0, 4.0, 100.0])
+
+    sums, counts, mins, maxs = group_stats(codes, values, 3)
+
+    np.testing.assert_allclose(sums, [5.0, 8.0, 0.0])
+    np.testing.assert_array_equal(counts, [2, 2, 0])
+    np.testing.assert_allclose(mins, [1.0, 3.0, np.nan])
+    np.testing.assert_allclose(maxs, [4.0, 5.0, np.nan])
+
+
+def test_group_mean() -> None:
+    """Test per-group means match a pandas groupby."""
+    rng = np.random.default_rng(0)
+    codes = rng.integers(0, 5, 1000)
+    values = rng.uniform(0, 1e6, 1000)
+    values[::7] = np.nan
+
+    expected = pd.Series(values).groupby(codes).mean().to_numpy()
+    np.testing.assert_allclose(group_mean(codes, values, 5), expected)
+
+
+def test_jit_matches_numpy() -> None:
+    """Test that the JIT kernel matches the NumPy path."""
+    if kernels._group_stats_jit is None:
+        pytest.skip("numba not installed")
+
+    rng = np.random.default_rng(1)
+    codes = rng.integers(-1, 20, 10_000)
+    values = rng.uniform(0, 1e6, 10_000)
+    values[::11] = np.nan
+
+    expected = kernels._group_stats_numpy(codes, values, 20)
+    actual = kernels._group_stats_jit(codes, values, 20)
+
+    for actual_column, expected_column in zip(actual, expected):
+        np.testing.assert_allclose(actual_column, expected_column)
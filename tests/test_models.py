@@ -1,43 +1,57 @@
 """Tests for Pydantic models."""
 
 import pytest
-from datetime import datetime
 
-from src.models.startup import StartupRaw, StartupClean, SectorAggregate
-
-
-def test_startup_raw_valid() -> None:
-    """Test valid StartupRaw model."""
-    data = {
-        "name": "Test Startup",
-        "sector": "Technology",
-        "founded_year": 2020,
-        "funding_rounds": 3,
-        "total_funding": 5000000.0,
-        "last_funding_date": "2023-01-15",
-        "status": "active",
-        "country": "USA",
-        "city": "San Francisco",
-        "employee_count": 50,
-    }
-
-    startup = StartupRaw(**data)
-    assert startup.name == "Test Startup"
-    assert startup.sector == "Technology"
-    assert startup.founded_year == 2020
-
-
-def test_startup_raw_missing_optional() -> None:
-    """Test StartupRaw with missing optional fields."""
-    data = {
-        "name": "Minimal Startup",
-        "sector": "Healthcare",
-    }
+import pandas as pd
+import pyarrow as pa
+from pydantic import ValidationError
+
+from src.models.schema import STARTUP_SCHEMA, validate_batch, validate_df
+from src.models.startup import CapitalDistribution, StartupRaw, StartupClean, SectorAggregate
+
+
+VALID_RAW = {
+    "name": "Test Startup",
+    "sector": "Technology",
+    "founded_year": 2020,
+    "funding_rounds": 3,
+    "total_funding": 5000000.0,
+    "last_funding_date": "2023-01-15",
+    "status": "active",
+    "country": "USA",
+    "city": "San Francisco",
+    "employee_count": 50,
+}
+MINIMAL_RAW = {
+    "name": "Minimal Startup",
+    "sector": "Healthcare",
+}
+BAD_YEAR_RAW = {
+    "name": "Test",
+    "sector": "Tech",
+    "founded_year": 1800,  # Invalid year
+}
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (VALID_RAW, {"name": "Test Startup", "sector": "Technology", "founded_year": 2020}),
+        (MINIMAL_RAW, {"name": "Minimal Startup", "funding_rounds": None, "total_funding": None}),
+        (BAD_YEAR_RAW, None),
+    ],
+    ids=["valid", "missing-optional", "bad-year"],
+)
+def test_startup_raw(data: dict, expected: dict | None) -> None:
+    """Test StartupRaw accepts valid and minimal records and rejects bad years."""
+    if expected is None:
+        with pytest.raises(ValidationError):
+            StartupRaw(**data)
+        return
 
     startup = StartupRaw(**data)
-    assert startup.name == "Minimal Startup"
-    assert startup.funding_rounds is None
-    assert startup.total_funding is None
+    for field, value in expected.items():
+        assert getattr(startup, field) == value
 
 
 def test_startup_clean_validation() -> None:
@@ -57,6 +71,25 @@ def test_startup_clean_validation() -> None:
     assert startup.total_funding == 1000000.0
 
 
+@pytest.mark.parametrize(
+    "sector,expected",
+    [("  E-COMMERCE ", "E-Commerce"), ("food & beverage", "Food & Beverage"), ("space tech", "Space Tech")],
+)
+def test_startup_clean_sector_normalization(sector: str, expected: str) -> None:
+    """Test known and unknown sectors normalize to title case."""
+    assert StartupClean(name="Test", sector=sector).sector == expected
+
+
+def test_startup_clean_is_frozen_and_forbids_extra_fields() -> None:
+    """Test models reject unknown fields and assignment after creation."""
+    with pytest.raises(ValidationError):
+        StartupClean(name="Test", sector="Technology", unexpected=1)
+
+    startup = StartupClean(name="Test", sector="Technology")
+    with pytest.raises(ValidationError):
+        startup.name = "Other"
+
+
 def test_sector_aggregate_valid() -> None:
     """Test valid SectorAggregate model."""
     data = {
@@ -82,15 +115,71 @@ def test_sector_aggregate_valid() -> None:
     assert len(sector.top_countries) == 2
 
 
-def test_startup_raw_year_validation() -> None:
-    """Test year validation in StartupRaw."""
-    data = {
-        "name": "Test",
-        "sector": "Tech",
-        "founded_year": 1800,  # Invalid year
+def test_validate_batch_matches_raw_model() -> None:
+    """Test vectorized batch validation drops the rows StartupRaw rejects."""
+    rows = [
+        {"name": "Valid", "sector": "  fin tech  ", "founded_year": 2020, "total_funding": 1.0},
+        {"name": "Missing", "sector": "Health"},
+        {"name": "Old", "sector": "Tech", "founded_year": 1800},
+        {"name": "Negative", "sector": "Tech", "employee_count": -1},
+    ]
+    batch = pa.RecordBatch.from_pylist(rows, schema=STARTUP_SCHEMA)
+
+    validated = validate_batch(batch)
+
+    assert validated.column("name").to_pylist() == ["Valid", "Missing"]
+    assert validated.column("sector").to_pylist() == ["Fin Tech", "Health"]
+    for row in validated.to_pylist():
+        StartupRaw(**row)
+
+
+def test_capital_distribution_fixed_fields() -> None:
+    """Test capital range labels load into fixed, zero-filled fields."""
+    sector = SectorAggregate(
+        sector="Technology",
+        total_startups=800,
+        active_startups=600,
+        closed_startups=200,
+        total_funding=1.0,
+        avg_funding_per_startup=1.0,
+        median_funding=1.0,
+        avg_funding_rounds=1.0,
+        growth_rate=0.1,
+        saturation_score=0.5,
+        risk_score=0.25,
+        capital_distribution={"0-1M": 300, "1M-10M": 500},
+    )
+
+    assert sector.model_dump()["capital_distribution"] == {
+        "cap_0": 0,
+        "cap_0_1m": 300,
+        "cap_1m_10m": 500,
+        "cap_10m_50m": 0,
+        "cap_50m_plus": 0,
     }
 
-    with pytest.raises(Exception):  # Should raise validation error
-        StartupRaw(**data)
+
+def test_validate_df_matches_raw_model() -> None:
+    """Test the DataFrame mask agrees with StartupRaw row by row."""
+    df = pd.DataFrame({
+        "name": ["a", "b", "c", "d"],
+        "sector": ["Tech"] * 4,
+        "founded_year": [2020, 1800, None, 2021],
+        "total_funding": [1.0, 2.0, 3.0, -5.0],
+    })
+
+    expected = []
+    for record in df.astype(object).where(df.notna(), None).to_dict("records"):
+        try:
+            StartupRaw(**record)
+            expected.append(True)
+        except ValidationError:
+            expected.append(False)
+
+    assert validate_df(df).tolist() == expected == [True, False, True, False]
 
 
+def test_capital_distribution_rejects_unknown_range() -> None:
+    """Test an unknown capital range label raises instead of dropping its count."""
+    with pytest.raises(ValidationError):
+        CapitalDistribution(**{"0-1M": 300, "1M-5M": 20})
@@ -3,13 +3,20 @@
 import pytest
 import pandas as pd
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
-from src.pipeline.data_generator import generate_startup_data, SECTORS, STATUSES
+from src.models.schema import CAPITAL_RANGES, SECTORS_SET
+from src.pipeline.aggregate import aggregate_by_sector, create_indexes
+from src.pipeline import clean
+from src.pipeline.clean import clean_data
+from src.pipeline.data_generator import generate_startup_data, save_data
+from src.pipeline.ingest import load_data_from_file
+from src.pipeline.materialize import MATERIALIZED_VIEWS, materialize_views
 
 
-def test_generate_startup_data() -> None:
+def test_generate_startup_data(small_df: pd.DataFrame) -> None:
     """Test data generation."""
-    df = generate_startup_data(num_records=100)
+    df = small_df
 
     assert len(df) == 100
     assert "name" in df.columns
@@ -23,38 +30,66 @@ def test_generate_startup_data() -> None:
     assert len(df.columns) >= 8  # Requirement: at least 8 columns
 
 
-def test_generate_data_sectors() -> None:
+def test_generate_data_sectors(small_df: pd.DataFrame) -> None:
     """Test that generated data uses valid sectors."""
-    df = generate_startup_data(num_records=50)
+    df = small_df
 
     # All sectors should be from the predefined list
-    unique_sectors = df["sector"].unique()
-    for sector in unique_sectors:
-        assert sector in SECTORS
+    assert set(df["sector"].unique()) <= SECTORS_SET
 
 
-def test_generate_data_ranges() -> None:
+def test_generate_data_ranges(small_df: pd.DataFrame) -> None:
     """Test that generated data has reasonable value ranges."""
-    df = generate_startup_data(num_records=100)
+    df = small_df
+
+    # One aggregation pass over the checked columns
+    stats = df.agg({
+        "founded_year": ["min", "max"],
+        "total_funding": ["min"],
+        "funding_rounds": ["min"],
+        "employee_count": ["min"],
+    })
 
     # Founded year should be in reasonable range
-    assert df["founded_year"].min() >= 2010
-    assert df["founded_year"].max() <= 2023
+    assert stats.loc["min", "founded_year"] >= 2010
+    assert stats.loc["max", "founded_year"] <= 2023
 
     # Funding should be non-negative
-    funding_cols = ["total_funding", "funding_rounds"]
-    for col in funding_cols:
-        if col in df.columns:
-            assert df[col].min() >= 0
+    assert stats.loc["min", "total_funding"] >= 0
+    assert stats.loc["min", "funding_rounds"] >= 0
 
     # Employee count should be positive
-    if "employee_count" in df.columns:
-        assert df["employee_count"].min() >= 1
+    assert stats.loc["min", "employee_count"] >= 1
+
+
+def test_generate_data_seed_is_reproducible() -> None:
+    """Test that a seed makes generated data reproducible."""
+    first = generate_startup_data(num_records=200, seed=42)
+    second = generate_startup_data(num_records=200, seed=42)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert not first.equals(generate_startup_data(num_records=200, seed=7))
+
+
+def test_save_data_parquet_roundtrip(tmp_path: Path) -> None:
+    """Test data saves as Parquet by default and loads with Arrow dtypes."""
+    df = generate_startup_data(num_records=100, seed=3)
+    data_file = tmp_path / "startups.parquet"
+
+    save_data(df, data_file)
+    loaded = load_data_from_file(data_file)
 
+    assert isinstance(loaded["sector"].dtype, pd.ArrowDtype)
+    expected = df.astype({col: "string" for col in df.select_dtypes("category").columns})
+    pd.testing.assert_frame_equal(
+        loaded.convert_dtypes(), expected.convert_dtypes(), check_dtype=False
+    )
 
-def test_data_generator_meets_requirements() -> None:
+
+@pytest.mark.slow
+def test_data_generator_meets_requirements(big_df: pd.DataFrame) -> None:
     """Test that generated data meets project requirements."""
-    df = generate_startup_data(num_records=1000000)
+    df = big_df
 
     # At least 750,000 rows (we generate 1M)
     assert len(df) >= 750000
@@ -77,3 +112,123 @@ def test_data_generator_meets_requirements() -> None:
         assert col in df.columns, f"Missing required column: {col}"
 
 
+def test_materialize_views_merges_and_prunes() -> None:
+    """Test each view is refreshed with $merge and stale sectors are removed."""
+    db = MagicMock()
+
+    materialize_views(db)
+
+    pipelines = [c.args[0] for c in db["aggregated_sectors"].aggregate.call_args_list]
+    assert len(pipelines) == len(MATERIALIZED_VIEWS)
+    for pipeline, view in zip(pipelines, MATERIALIZED_VIEWS):
+        assert pipeline[-1]["$merge"]["into"] == view
+        assert pipeline[-2]["$set"]["_id"] == "$sector"
+    refresh_ids = {p[-2]["$set"]["refresh_id"] for p in pipelines}
+    assert len(refresh_ids) == 1
+    db["mv_top_sectors"].delete_many.assert_called_with({"refresh_id": {"$ne": refresh_ids.pop()}})
+
+
+def test_aggregate_by_sector_stores_year_span() -> None:
+    """Test the founding year span is stored for indexed timeline sorts."""
+    df = pd.DataFrame({
+        "sector": ["Fintech", "Fintech", "Fintech"],
+        "status": ["active", "closed", "active"],
+        "total_funding": [1.0e6, 2.0e6, 3.0e6],
+        "funding_rounds": [1, 2, 3],
+        "employee_count": [10, 20, 30],
+        "founded_year": [2005, 2012, 2019],
+        "country": ["USA", "UK", "USA"],
+        "capital_range": ["1M-10M", "1M-10M", "1M-10M"],
+    })
+
+    aggregated = aggregate_by_sector(df)
+
+    row = aggregated.iloc[0]
+    assert row["year_span"] == row["founded_year_max"] - row["founded_year_min"] == 14
+
+
+def test_clean_data_derived_categories() -> None:
+    """Test funding stage and capital range buckets, including boundaries."""
+    df = pd.DataFrame({
+        "name": ["A", "B", "C", "D", "E"],
+        "sector": ["fintech"] * 5,
+        "founded_year": [2015] * 5,
+        "funding_rounds": [0, 1, 2, 3, 5],
+        "total_funding": [0.0, 999_999.0, 1_000_000.0, 10_000_000.0, 50_000_000.0],
+        "status": ["active"] * 5,
+        "country": ["USA"] * 5,
+        "city": ["Austin"] * 5,
+    })
+
+    cleaned = clean_data(df)
+
+    assert cleaned["funding_stage"].tolist() == [
+        "pre-seed", "seed", "series-a", "series-b", "series-c-plus"
+    ]
+    assert cleaned["capital_range"].tolist() == ["0-0", "0-1M", "1M-10M", "10M-50M", "50M+"]
+    assert isinstance(cleaned["capital_range"].dtype, pd.CategoricalDtype)
+    assert cleaned["capital_range"].dtype.ordered
+    assert list(cleaned["capital_range"].cat.categories) == list(CAPITAL_RANGES)
+
+
+def test_clean_data_normalizes_text() -> None:
+    """Test text columns are trimmed, cased, and missing values filled."""
+    df = pd.DataFrame({
+        "name": ["  Acme ", "nan", "Beta"],
+        "sector": [" fin tech", "Health", "retail "],
+        "founded_year": [2015, 2016, 2017],
+        "funding_rounds": [1, 1, 1],
+        "total_funding": [1.0e6, 1.0e6, 1.0e6],
+        "status": [" ACTIVE ", "closed", None],
+        "country": ["USA", None, "UK"],
+        "city": ["Austin", "Boston", None],
+    })
+
+    cleaned = clean_data(df)
+
+    assert cleaned["name"].tolist() == ["Acme", "Beta"]
+    assert cleaned["sector"].tolist() == ["Fin Tech", "Retail"]
+    assert cleaned["status"].tolist() == ["active", "unknown"]
+    assert cleaned["city"].tolist() == ["Austin", ""]
+
+
+def test_clean_data_parallel_matches_serial(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test validating across worker processes gives the same records."""
+    df = generate_startup_data(num_records=500, seed=1)
+    monkeypatch.setattr(clean, "PARALLEL_MIN_ROWS", 0)
+
+    serial = clean_data(df.copy(), workers=1)
+    parallel = clean_data(df.copy(), workers=2)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_aggregate_top_countries_break_ties_by_name() -> None:
+    """Test top countries are ranked by count, then by name."""
+    df = pd.DataFrame({
+        "sector": ["Fintech"] * 5,
+        "status": ["active"] * 5,
+        "total_funding": [1.0e6] * 5,
+        "funding_rounds": [1] * 5,
+        "employee_count": [10] * 5,
+        "founded_year": [2015] * 5,
+        "country": ["USA", "UK", "India", "UK", "Canada"],
+        "capital_range": ["1M-10M"] * 5,
+    }).astype({"sector": "category", "country": "category"})
+
+    aggregated = aggregate_by_sector(df)
+
+    assert aggregated.iloc[0]["top_countries"] == ["UK", "Canada", "India", "USA"]
+
+
+@patch("src.pipeline.aggregate.get_database")
+def test_create_indexes_single_call(mock_get_db: MagicMock) -> None:
+    """Test aggregated_sectors indexes are created in one createIndexes call."""
+    collection = mock_get_db.return_value["aggregated_sectors"]
+
+    create_indexes()
+
+    collection.create_indexes.assert_called_once()
+    collection.create_index.assert_not_called()
+    indexes = [model.document for model in collection.create_indexes.call_args.args[0]]
+    assert indexes[0]["key"] == {"sector": 1} and indexes[0]["unique"] is True
@@ -0,0 +1,69 @@
+"""Tests for opportunity score adjustments."""
+
+import numpy as np
+import pytest
+
+from src.analytics import scoring
+from src.analytics.scoring import (
+    CAPITAL_50K_500K,
+    CAPITAL_500K_5M,
+    CAPITAL_ANY,
+    CAPITAL_UNDER_50K,
+    RISK_ANY,
+    RISK_HIGH,
+    RISK_LOW,
+    RISK_MEDIUM,
+    adjust_scores,
+)
+
+
+def test_adjust_scores_no_preferences() -> None:
+    """Test that scores are unchanged without preferences."""
+    base = np.array([5.0, 7.5])
+    score = adjust_scores(base, np.array([0.2, 0.6]), np.array([1e5, 1e6]))
+
+    np.testing.assert_allclose(score, base)
+    assert score is not base
+
+
+def test_adjust_scores_risk_and_capital() -> None:
+    """Test combined risk and capital adjustments."""
+    base = np.array([5.0, 5.0])
+    risk = np.array([0.2, 0.6])
+    funding = np.array([250000.0, 1000000.0])
+
+    score = adjust_scores(base, risk, funding, RISK_LOW, CAPITAL_UNDER_50K)
+
+    expected = base + (1 - risk) * 2 + (1 - funding / funding.max()) * 1.5
+    np.testing.assert_allclose(score, expected)
+
+
+@pytest.mark.parametrize("risk_choice", [RISK_ANY, RISK_LOW, RISK_MEDIUM, RISK_HIGH])
+@pytest.mark.parametrize(
+    "capital_choice", [CAPITAL_ANY, CAPITAL_UNDER_50K, CAPITAL_50K_500K, CAPITAL_500K_5M]
+)
+def test_adjust_scores_matches_formulas(risk_choice: int, capital_choice: int) -> None:
+    """Test every risk and capital choice against its scoring formula."""
+    rng = np.random.default_rng(0)
+    base = rng.uniform(0, 10, 1000)
+    risk = rng.uniform(0, 1, 1000)
+    funding = rng.uniform(1e4, 5e7, 1000)
+    funding_max = funding.max()
+
+    risk_adjustment = {
+        RISK_ANY: 0.0,
+        RISK_LOW: (1 - risk) * 2,
+        RISK_MEDIUM: (1 - np.abs(risk - scoring.MEDIUM_RISK_TARGET)) * 2,
+        RISK_HIGH: risk * 2,
+    }[risk_choice]
+    target = scoring.MID_CAPITAL_TARGET
+    capital_adjustment = {
+        CAPITAL_ANY: 0.0,
+        CAPITAL_UNDER_50K: (1 - funding / funding_max) * 1.5,
+        CAPITAL_50K_500K: (1 - np.abs(funding - target) / target) * 1.5,
+        CAPITAL_500K_5M: funding / funding_max * 1.5,
+    }[capital_choice]
+
+    score = adjust_scores(base, risk, funding, risk_choice, capital_choice)
+
+    np.testing.assert_allclose(score, base + risk_adjustment + capital_adjustment)